@@ -2,35 +2,76 @@
 
 from __future__ import annotations
 
-# Core (generic)
-from .core import DatasetBuilderConfig, build_hf_dataset, push_dataset_to_hub
-
-# Datasets
-from .datasets import (
-    build_and_push_aomic_piop1,
-    build_and_push_arc,
-    build_and_push_isles24,
-    build_aomic_piop1_file_table,
-    build_arc_file_table,
-    build_isles24_file_table,
-    get_aomic_piop1_features,
-    get_arc_features,
-    get_isles24_features,
-)
-
-# Patches (opt-in)
-from .patches import apply_nifti_lazy_loading_patch
-
-# Validation
-from .validation import (
-    ValidationResult,
-    validate_aomic_piop1_download,
-    validate_arc_download,
-    validate_isles24_download,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Core (generic)
+    from .core import DatasetBuilderConfig, build_hf_dataset, push_dataset_to_hub
+
+    # Datasets
+    from .datasets import (
+        build_and_push_aomic_piop1,
+        build_and_push_arc,
+        build_and_push_isles24,
+        build_aomic_piop1_file_table,
+        build_arc_file_table,
+        build_isles24_file_table,
+        get_aomic_piop1_features,
+        get_arc_features,
+        get_isles24_features,
+    )
+
+    # Patches (opt-in)
+    from .patches import apply_nifti_lazy_loading_patch
+
+    # Validation
+    from .validation import (
+        ValidationResult,
+        validate_aomic_piop1_download,
+        validate_arc_download,
+        validate_isles24_download,
+    )
 
 __version__ = "0.2.0"
 
+# Public name -> submodule defining it. Resolved on first attribute access so that
+# `import bids_hub.validation` (e.g. from the CLI's validate commands) does not pay
+# for importing `datasets`/pandas through the builder modules.
+_LAZY_EXPORTS = {
+    "DatasetBuilderConfig": ".core",
+    "build_hf_dataset": ".core",
+    "push_dataset_to_hub": ".core",
+    "build_and_push_aomic_piop1": ".datasets",
+    "build_and_push_arc": ".datasets",
+    "build_and_push_isles24": ".datasets",
+    "build_aomic_piop1_file_table": ".datasets",
+    "build_arc_file_table": ".datasets",
+    "build_isles24_file_table": ".datasets",
+    "get_aomic_piop1_features": ".datasets",
+    "get_arc_features": ".datasets",
+    "get_isles24_features": ".datasets",
+    "apply_nifti_lazy_loading_patch": ".patches",
+    "ValidationResult": ".validation",
+    "validate_aomic_piop1_download": ".validation",
+    "validate_arc_download": ".validation",
+    "validate_isles24_download": ".validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
+
 __all__ = [
     "DatasetBuilderConfig",
     "ValidationResult",
@@ -21,19 +21,18 @@ Usage:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 
-from .core import DatasetBuilderConfig
-from .datasets.aomic_piop1 import build_and_push_aomic_piop1
-from .datasets.arc import build_and_push_arc
-from .datasets.isles24 import build_and_push_isles24
 from .validation import (
+    ISLES24_ARCHIVE_MD5,
     validate_aomic_piop1_download,
     validate_arc_download,
     validate_arc_hf_from_hub,
     validate_isles24_download,
+    verify_md5_async,
 )
 
 app = typer.Typer(
@@ -100,6 +99,10 @@ def build_arc(
     """
     Build (and optionally push) the ARC HF dataset.
     """
+    # Deferred: the builders import `datasets`, which validate/info commands never need
+    from .core import DatasetBuilderConfig
+    from .datasets.arc import build_and_push_arc
+
     config = DatasetBuilderConfig(
         bids_root=bids_root,
         hf_repo_id=hf_repo,
@@ -148,7 +151,7 @@ def validate_arc(
     Validate an ARC dataset download before pushing to HuggingFace.
 
     Checks:
-    - Zero-byte file detection (fast corruption check)
+    - Zero-byte and malformed-gzip detection (fast corruption checks)
     - Required BIDS files exist (dataset_description.json, participants.tsv, participants.json)
     - Subject/session counts match SSOT expectations (OpenNeuro ds004884)
     - Modality counts match SSOT expectations (sessions with ≥1 file)
@@ -198,6 +201,11 @@ def validate_arc_hf_cmd(
         "--skip-nifti",
         help="Skip NIfTI loadability checks (faster).",
     ),
+    full_nifti_scan: bool = typer.Option(
+        False,
+        "--full-nifti-scan",
+        help="Check NIfTI files in every row (multiprocess) instead of sampling.",
+    ),
 ) -> None:
     """
     Validate an ARC dataset downloaded from HuggingFace Hub.
@@ -224,6 +232,7 @@ def validate_arc_hf_cmd(
         split=split,
         nifti_sample_size=sample_size,
         check_nifti=not skip_nifti,
+        full_scan=full_nifti_scan,
     )
 
     typer.echo(result.summary())
@@ -280,6 +289,10 @@ def build_isles(
     """
     Build (and optionally push) the ISLES'24 HF dataset.
     """
+    # Deferred: the builders import `datasets`, which validate/info commands never need
+    from .core import DatasetBuilderConfig
+    from .datasets.isles24 import build_and_push_isles24
+
     config = DatasetBuilderConfig(
         bids_root=bids_root,
         hf_repo_id=hf_repo,
@@ -318,27 +331,41 @@ def validate_isles(
         max=1.0,
         help="Allowed fraction of missing files (0.0 to 1.0). Default 0.1 (10%).",
     ),
+    archive: Path | None = typer.Option(
+        None,
+        "--archive",
+        help="Also verify the MD5 of the downloaded train.7z (hashed during the other checks).",
+    ),
 ) -> None:
     """
     Validate an ISLES24 dataset download.
 
     Checks:
-    - Zero-byte file detection (fast corruption check)
+    - Zero-byte and malformed-gzip detection (fast corruption checks)
     - Required files exist (clinical_data-description.xlsx)
     - Required directories exist (raw_data/, derivatives/, phenotype/)
     - Subject count matches expected (~149 from Zenodo v7)
     - Modality counts match expected (NCCT, CTA, DWI, lesion masks)
     - Sample NIfTI files are loadable with nibabel
     - Phenotype XLSX files are readable
+    - (Optional) train.7z archive MD5 matches Zenodo
 
     Example:
-        bids-hub isles24 validate data/zenodo/isles24/train
+        bids-hub isles24 validate data/zenodo/isles24/train --archive data/zenodo/train.7z
     """
-    result = validate_isles24_download(
-        bids_root,
-        nifti_sample_size=sample_size,
-        tolerance=tolerance,
-    )
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        archive_check = (
+            verify_md5_async(archive, ISLES24_ARCHIVE_MD5, pool, parallel=True)
+            if archive is not None
+            else None
+        )
+        result = validate_isles24_download(
+            bids_root,
+            nifti_sample_size=sample_size,
+            tolerance=tolerance,
+        )
+        if archive_check is not None:
+            result.add(archive_check.result())
 
     typer.echo(result.summary())
 
@@ -386,6 +413,10 @@ def build_aomic_piop1(
     """
     Build (and optionally push) the AOMIC-PIOP1 HF dataset.
     """
+    # Deferred: the builders import `datasets`, which validate/info commands never need
+    from .core import DatasetBuilderConfig
+    from .datasets.aomic_piop1 import build_and_push_aomic_piop1
+
     config = DatasetBuilderConfig(
         bids_root=bids_root,
         hf_repo_id=hf_repo,
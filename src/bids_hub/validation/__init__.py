@@ -30,15 +30,18 @@ from .base import (
     ValidationCheck,
     ValidationResult,
     check_count,
+    check_gzip_trailers,
     check_zero_byte_files,
     validate_dataset,
     verify_md5,
+    verify_md5_async,
 )
 
 # --- Generic HuggingFace validation (hf.py) ---
 from .hf import (
     HFValidationCheck,
     HFValidationResult,
+    check_column_counts,
     check_list_alignment,
     check_list_sessions,
     check_non_null_count,
@@ -76,7 +79,9 @@ __all__ = [
     "HFValidationResult",
     "ValidationCheck",
     "ValidationResult",
+    "check_column_counts",
     "check_count",
+    "check_gzip_trailers",
     "check_list_alignment",
     "check_list_sessions",
     "check_non_null_count",
@@ -94,4 +99,5 @@ __all__ = [
     "validate_isles24_download",
     "verify_isles24_archive",
     "verify_md5",
+    "verify_md5_async",
 ]
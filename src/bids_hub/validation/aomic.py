@@ -48,12 +48,13 @@ def validate_aomic_piop1_download(
     run_bids_validator: bool = False,
     nifti_sample_size: int = 10,
     tolerance: float = 0.0,
+    fail_fast: bool = False,
 ) -> ValidationResult:
     """
     Validate an AOMIC-PIOP1 dataset download.
 
     This function checks:
-    1. Zero-byte file detection (fast corruption check)
+    1. Zero-byte and malformed-gzip detection (fast corruption checks)
     2. Required BIDS files exist
     3. Subject count matches expected (216)
     4. Modality counts match expected (T1w, DWI, BOLD)
@@ -65,6 +66,8 @@ def validate_aomic_piop1_download(
         run_bids_validator: If True, run external BIDS validator (slow).
         nifti_sample_size: Number of NIfTI files to spot-check.
         tolerance: Allowed missing fraction (0.0 to 1.0). Default 0.0 (strict).
+        fail_fast: If True, skip the expensive checks when required files are
+            missing or no subjects are found (see validate_dataset).
 
     Returns:
         ValidationResult with all check outcomes.
@@ -75,4 +78,5 @@ def validate_aomic_piop1_download(
         run_bids_validator=run_bids_validator,
         nifti_sample_size=nifti_sample_size,
         tolerance=tolerance,
+        fail_fast=fail_fast,
     )
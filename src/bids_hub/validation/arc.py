@@ -10,8 +10,10 @@ Uses the generic validation frameworks from base.py (BIDS) and hf.py (HuggingFac
 from __future__ import annotations
 
 import logging
+import os
+import random
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .base import (
     DatasetValidationConfig,
@@ -23,12 +25,10 @@ from .base import (
 from .hf import (
     HFValidationCheck,
     HFValidationResult,
+    check_column_counts,
     check_list_alignment,
-    check_list_sessions,
-    check_non_null_count,
     check_row_count,
     check_schema,
-    check_total_list_items,
     check_unique_values,
 )
 
@@ -37,6 +37,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Lesion masks in derivatives/lesion_masks/ (verified against SSOT)
+_ARC_LESION_MASK_COUNT = 228
+
 
 def _check_lesion_masks(bids_root: Path) -> ValidationCheck:
     """Count lesion masks in derivatives/lesion_masks/.
@@ -51,7 +54,7 @@ def _check_lesion_masks(bids_root: Path) -> ValidationCheck:
     if not lesion_dir.exists():
         return ValidationCheck(
             name="lesion_count",
-            expected=">= 228 (target: 228)",
+            expected=f">= {_ARC_LESION_MASK_COUNT} (target: {_ARC_LESION_MASK_COUNT})",
             actual="0",
             passed=False,
             details="derivatives/lesion_masks/ directory not found",
@@ -61,7 +64,7 @@ def _check_lesion_masks(bids_root: Path) -> ValidationCheck:
     lesion_files = list(lesion_dir.rglob("*_desc-lesion_mask.nii.gz"))
     # For ARC, we count raw files since each session has exactly 0 or 1 lesion mask
     actual = len(lesion_files)
-    return check_count("lesion_count", actual, expected=228, tolerance=0.0)
+    return check_count("lesion_count", actual, expected=_ARC_LESION_MASK_COUNT, tolerance=0.0)
 
 
 # Expected counts verified against SSOT (OpenNeuro ds004884, 2025-12-14).
@@ -115,24 +118,19 @@ ARC_VALIDATION_CONFIG = DatasetValidationConfig(
 
 
 # Backward compatibility aliases - preserve old API
-# NOTE: These are SESSIONS with modality, not raw file counts (see comment above)
+# NOTE: These are SESSIONS with modality, not raw file counts (see comment above).
+# Derived from ARC_VALIDATION_CONFIG so the two can never disagree.
 EXPECTED_COUNTS = {
-    "subjects": 230,
-    "sessions": 902,
-    "t1w_series": 444,  # Sessions with T1w
-    "t2w_series": 440,  # Sessions with T2w
-    "flair_series": 233,  # Sessions with FLAIR
-    "bold_series": 850,  # Sessions with BOLD
-    "dwi_series": 613,  # Sessions with DWI
-    "sbref_series": 88,  # Sessions with sbref
-    "lesion_masks": 228,  # Lesion masks in derivatives (verified)
+    "subjects": ARC_VALIDATION_CONFIG.expected_counts["subjects"],
+    "sessions": ARC_VALIDATION_CONFIG.expected_counts["sessions"],
+    **{
+        f"{modality}_series": ARC_VALIDATION_CONFIG.expected_counts[modality]
+        for modality in ("t1w", "t2w", "flair", "bold", "dwi", "sbref")
+    },
+    "lesion_masks": _ARC_LESION_MASK_COUNT,  # Lesion masks in derivatives (verified)
 }
 
-REQUIRED_BIDS_FILES = [
-    "dataset_description.json",
-    "participants.tsv",
-    "participants.json",
-]
+REQUIRED_BIDS_FILES = list(ARC_VALIDATION_CONFIG.required_files)
 
 
 def validate_arc_download(
@@ -140,12 +138,13 @@ def validate_arc_download(
     run_bids_validator: bool = False,
     nifti_sample_size: int = 10,
     tolerance: float = 0.0,
+    fail_fast: bool = False,
 ) -> ValidationResult:
     """
     Validate an ARC dataset download.
 
     This function checks:
-    1. Zero-byte file detection (fast corruption check)
+    1. Zero-byte and malformed-gzip detection (fast corruption checks)
     2. Required BIDS files exist
     3. Subject count matches expected (~230)
     4. Session count matches expected (~902)
@@ -158,6 +157,8 @@ def validate_arc_download(
         run_bids_validator: If True, run external BIDS validator (slow).
         nifti_sample_size: Number of NIfTI files to spot-check.
         tolerance: Allowed missing fraction (0.0 to 1.0). Default 0.0 (strict).
+        fail_fast: If True, skip the expensive checks when required files are
+            missing or no subjects are found (see validate_dataset).
 
     Returns:
         ValidationResult with all check outcomes.
@@ -168,6 +169,7 @@ def validate_arc_download(
         run_bids_validator=run_bids_validator,
         nifti_sample_size=nifti_sample_size,
         tolerance=tolerance,
+        fail_fast=fail_fast,
     )
 
 
@@ -226,10 +228,37 @@ ARC_HF_EXPECTED_COUNTS = {
 }
 
 
+# (column, ARC_HF_EXPECTED_COUNTS key) pairs checked by validate_arc_hf
+_SINGLETON_NONNULL_CHECKS: tuple[tuple[str, str], ...] = (("lesion", "lesion_non_null"),)
+_LIST_SESSION_CHECKS: tuple[tuple[str, str], ...] = (
+    ("t1w", "t1w_sessions"),
+    ("t2w", "t2w_sessions"),
+    ("flair", "flair_sessions"),
+    ("bold_naming40", "bold_naming40_sessions"),
+    ("bold_rest", "bold_rest_sessions"),
+    ("dwi", "dwi_sessions"),
+    ("sbref", "sbref_sessions"),
+)
+_TOTAL_ITEM_CHECKS: tuple[tuple[str, str], ...] = (
+    ("t1w", "t1w_files"),
+    ("t2w", "t2w_files"),
+    ("flair", "flair_files"),
+    ("bold_naming40", "bold_naming40_runs"),
+    ("bold_rest", "bold_rest_runs"),
+    ("dwi", "dwi_runs"),
+    ("sbref", "sbref_runs"),
+)
+
+# Every (column, reduction, ARC_HF_EXPECTED_COUNTS key) above, for one check_column_counts call
+_ARC_HF_COUNT_CHECKS: tuple[tuple[str, str, str], ...] = (
+    *((col, "non_null", key) for col, key in _SINGLETON_NONNULL_CHECKS),
+    *((col, "list_sessions", key) for col, key in _LIST_SESSION_CHECKS),
+    *((col, "list_total", key) for col, key in _TOTAL_ITEM_CHECKS),
+)
+
+
 def _check_nifti_loadable(ds: Dataset, sample_size: int = 5) -> HFValidationCheck:
     """Spot-check that NIfTI files in the HF dataset are loadable."""
-    import random
-
     errors = []
     checked = 0
 
@@ -280,10 +309,77 @@ def _check_nifti_loadable(ds: Dataset, sample_size: int = 5) -> HFValidationChec
     )
 
 
+def _check_shapes_batched(batch: dict[str, list[Any]]) -> dict[str, list[Any]]:
+    """Check T1w/BOLD dimensionality for a batch of rows.
+
+    Returns only plain error strings (empty when the row is OK) so no NIfTI
+    objects are pickled back from worker processes.
+    """
+    errors: list[str] = []
+    for subject_id, session_id, t1w, bold in zip(
+        batch["subject_id"],
+        batch["session_id"],
+        batch["t1w"],
+        batch["bold_naming40"],
+        strict=True,
+    ):
+        row_id = f"{subject_id}/{session_id}"
+        row_errors = []
+        try:
+            for i, img in enumerate(t1w or []):
+                if len(img.shape) != 3:
+                    row_errors.append(f"{row_id} t1w[{i}]: unexpected shape {img.shape}")
+            if bold and len(bold[0].shape) != 4:
+                row_errors.append(f"{row_id} bold_naming40[0]: unexpected shape {bold[0].shape}")
+        except Exception as e:
+            row_errors.append(f"{row_id}: {e}")
+        errors.append("; ".join(row_errors))
+    return {"nifti_error": errors}
+
+
+def _check_nifti_loadable_batched(ds: Dataset, num_proc: int | None = None) -> HFValidationCheck:
+    """Check every row's T1w NIfTIs and first naming40 BOLD run for the expected rank.
+
+    Uses a batched, multiprocess `Dataset.map` so a full scan scales with cores.
+    """
+    ds_view = ds.select_columns(["subject_id", "session_id", "t1w", "bold_naming40"])
+    if num_proc is None:
+        num_proc = os.cpu_count() or 1
+    num_proc = max(1, min(num_proc, len(ds_view)))
+
+    flags = ds_view.map(
+        _check_shapes_batched,
+        batched=True,
+        batch_size=32,
+        num_proc=num_proc if num_proc > 1 else None,
+        remove_columns=ds_view.column_names,
+        keep_in_memory=False,
+        desc="Checking NIfTI shapes",
+    )
+    errors = [err for err in flags["nifti_error"] if err]
+
+    if not errors:
+        return HFValidationCheck(
+            name="nifti_loadable",
+            expected=f"{len(ds_view)} rows loadable",
+            actual=f"{len(ds_view)} checked, all OK",
+            passed=True,
+        )
+
+    return HFValidationCheck(
+        name="nifti_loadable",
+        expected=f"{len(ds_view)} rows loadable",
+        actual=f"{len(errors)} rows with errors",
+        passed=False,
+        details="; ".join(errors[:3]),
+    )
+
+
 def validate_arc_hf(
     ds: Dataset,
     nifti_sample_size: int = 5,
     check_nifti: bool = True,
+    full_scan: bool = False,
 ) -> HFValidationResult:
     """
     Validate an ARC HuggingFace dataset against SSOT expectations.
@@ -292,57 +388,45 @@ def validate_arc_hf(
         ds: HuggingFace Dataset to validate.
         nifti_sample_size: Number of NIfTI files to spot-check.
         check_nifti: If True, verify NIfTI files are loadable.
+        full_scan: If True, check every row's NIfTI files (multiprocess)
+            instead of a random sample of `nifti_sample_size` rows.
 
     Returns:
         HFValidationResult with all check outcomes.
     """
     result = HFValidationResult(dataset_name="hugging-science/arc-aphasia-bids")
 
+    # Materialize the Arrow table once; all column checks below share it.
+    table = ds.data.table
+
     # Schema check
-    result.add(check_schema(ds, ARC_HF_EXPECTED_SCHEMA))
+    result.add(check_schema(table, ARC_HF_EXPECTED_SCHEMA))
 
     # Row count
     result.add(check_row_count(ds, ARC_HF_EXPECTED_COUNTS["rows"]))
 
     # Unique subjects
     result.add(
-        check_unique_values(ds, "subject_id", ARC_HF_EXPECTED_COUNTS["subjects"], "unique_subjects")
+        check_unique_values(
+            table, "subject_id", ARC_HF_EXPECTED_COUNTS["subjects"], check_name="unique_subjects"
+        )
     )
 
-    # Singleton modality non-null counts
-    for col, key in [
-        ("lesion", "lesion_non_null"),
-    ]:
-        result.add(check_non_null_count(ds, col, ARC_HF_EXPECTED_COUNTS[key]))
-
-    # List modality session counts
-    for col, key in [
-        ("t1w", "t1w_sessions"),
-        ("t2w", "t2w_sessions"),
-        ("flair", "flair_sessions"),
-        ("bold_naming40", "bold_naming40_sessions"),
-        ("bold_rest", "bold_rest_sessions"),
-        ("dwi", "dwi_sessions"),
-        ("sbref", "sbref_sessions"),
-    ]:
-        result.add(check_list_sessions(ds, col, ARC_HF_EXPECTED_COUNTS[key]))
-
-    # Total run counts
-    for col, key in [
-        ("t1w", "t1w_files"),
-        ("t2w", "t2w_files"),
-        ("flair", "flair_files"),
-        ("bold_naming40", "bold_naming40_runs"),
-        ("bold_rest", "bold_rest_runs"),
-        ("dwi", "dwi_runs"),
-        ("sbref", "sbref_runs"),
-    ]:
-        result.add(check_total_list_items(ds, col, ARC_HF_EXPECTED_COUNTS[key]))
+    # Singleton non-null counts, list modality session counts and total run counts,
+    # all computed in one pass over the table
+    for check in check_column_counts(
+        table,
+        [
+            (col, reduction, ARC_HF_EXPECTED_COUNTS[key])
+            for col, reduction, key in _ARC_HF_COUNT_CHECKS
+        ],
+    ):
+        result.add(check)
 
     # DWI gradient alignment
     result.add(
         check_list_alignment(
-            ds,
+            table,
             ["dwi", "dwi_bvals", "dwi_bvecs"],
             row_id_columns=["subject_id", "session_id"],
         )
@@ -350,7 +434,10 @@ def validate_arc_hf(
 
     # NIfTI loadability (optional, can be slow)
     if check_nifti:
-        result.add(_check_nifti_loadable(ds, nifti_sample_size))
+        if full_scan:
+            result.add(_check_nifti_loadable_batched(ds))
+        else:
+            result.add(_check_nifti_loadable(ds, nifti_sample_size))
 
     return result
 
@@ -360,6 +447,7 @@ def validate_arc_hf_from_hub(
     split: str = "train",
     nifti_sample_size: int = 5,
     check_nifti: bool = True,
+    full_scan: bool = False,
 ) -> HFValidationResult:
     """
     Load and validate an ARC dataset directly from HuggingFace Hub.
@@ -369,6 +457,7 @@ def validate_arc_hf_from_hub(
         split: Dataset split to validate.
         nifti_sample_size: Number of NIfTI files to spot-check.
         check_nifti: If True, verify NIfTI files are loadable.
+        full_scan: If True, check NIfTI files in every row instead of sampling.
 
     Returns:
         HFValidationResult with all check outcomes.
@@ -382,4 +471,5 @@ def validate_arc_hf_from_hub(
         ds,
         nifti_sample_size=nifti_sample_size,
         check_nifti=check_nifti,
+        full_scan=full_scan,
     )
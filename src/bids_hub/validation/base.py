@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import hashlib
+import json
+import mmap
+import os
 import random
+import re
 import shutil
+import struct
 import subprocess
-from collections.abc import Callable
+import zlib
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+# Incremental-validation caches of check_zero_byte_files live under the user cache
+# dir ($XDG_CACHE_HOME or ~/.cache), never inside the dataset being validated.
+_CACHE_SUBDIR = Path("bids_hub") / "zero_byte_scan"
 
-@dataclass
+# gzip framing: 2-byte magic, and the smallest valid member (10-byte header,
+# empty deflate block, 8-byte CRC32 + ISIZE trailer).
+_GZIP_MAGIC = b"\x1f\x8b"
+_GZIP_MIN_SIZE = 18
+
+# MD5 of zero bytes; empty archives are answered without opening them.
+_EMPTY_MD5 = "d41d8cd98f00b204e9800998ecf8427e"
+
+# Hashes computed by verify_md5 in this process, keyed by file identity (device,
+# inode, size, mtime, ctime). Links and symlinked mirrors of an archive share an
+# inode, so they are hashed once; any write to the file changes its ctime.
+_MD5_MEMO: dict[tuple[int, int, int, int, int], str] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationCheck:
     """Result of a single validation check.
 
@@ -40,6 +67,26 @@ class ValidationResult:
     bids_root: Path
     checks: list[ValidationCheck] = field(default_factory=list)
 
+    # Everything below is derived from `checks` when read, so callers may append,
+    # extend or replace the list directly without desynchronising the result.
+    def __getitem__(self, name: str) -> ValidationCheck:
+        """Return the first check named `name`; raises KeyError if there is none.
+
+        Lookup sugar over `by_name`, so a linear scan of `checks`.
+        """
+        check = self.by_name(name)
+        if check is None:
+            raise KeyError(name)
+        return check
+
+    def by_name(self, name: str) -> ValidationCheck | None:
+        """Return the first check named `name`, or None if there is none.
+
+        O(n) in the number of checks: there is no name index to go stale when
+        `checks` is mutated, and a result holds a few dozen checks at most.
+        """
+        return next((c for c in self.checks if c.name == name), None)
+
     @property
     def all_passed(self) -> bool:
         """Return True if all checks passed (skipped checks count as passed)."""
@@ -100,7 +147,7 @@ class ValidationResult:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatasetValidationConfig:
     """Configuration for validating a specific dataset."""
 
@@ -144,47 +191,305 @@ def check_count(
     )
 
 
-def check_zero_byte_files(bids_root: Path) -> tuple[int, list[str]]:
+@dataclass(slots=True, frozen=True)
+class _ScanContext:
+    """One walk of a dataset tree, shared by every check of a validation run.
+
+    Paths are POSIX-style and relative to `root`.
+    """
+
+    root: Path
+    files: list[tuple[str, int]]  # (path, size in bytes)
+    dirs: list[str]
+
+    def glob_count(self, pattern: str) -> int:
+        """Number of entries matching `pattern`, like `len(list(root.glob(pattern)))`."""
+        regex = _glob_to_regex(pattern)
+        return sum(1 for d in self.dirs if regex.fullmatch(d)) + sum(
+            1 for f, _ in self.files if regex.fullmatch(f)
+        )
+
+    def rglob(self, pattern: str) -> list[Path]:
+        """Files matching `pattern` at any depth, like `root.rglob(pattern)`."""
+        regex = _glob_to_regex(pattern, recursive=True)
+        return [self.root / f for f, _ in self.files if regex.fullmatch(f)]
+
+
+def _scan_tree(
+    root: Path,
+    cache: dict[str, Any] | None = None,
+    record: dict[str, dict[str, Any]] | None = None,
+) -> _ScanContext:
+    """Walk `root` once, recording every directory and the size of every file.
+
+    Directory symlinks are followed at every depth, with each real directory
+    entered once so link cycles terminate. Non-recursive `Path.glob` patterns
+    follow them too, but `Path.rglob` (Python < 3.13) does not descend through
+    them; recursive scans here therefore also cover symlinked trees such as
+    datalad/git-annex subject dirs. Unreadable subdirectories are skipped.
+    Sizes follow symlinks; a broken link (e.g. annexed content that was never
+    fetched) reads as empty.
+
+    `cache` holds per-directory entries from an earlier scan (see `_load_cache`):
+    in a directory whose mtime is unchanged, cached sizes are used instead of
+    stat'ing files. Malformed entries and names missing from them are stat'ed as
+    usual. If `record` is given, every directory's entry is written into it.
+    """
+    files: list[tuple[str, int]] = []
+    dirs: list[str] = []
+    root_st = root.stat()
+    visited = {(root_st.st_dev, root_st.st_ino)}
+    stack = [(root, "", root_st.st_mtime_ns)]
+    while stack:
+        directory, prefix, mtime_ns = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            if directory is root:
+                raise
+            continue  # e.g. PermissionError: skipped, as pathlib globbing does
+        rel_dir = prefix.rstrip("/") or "."
+        cached_sizes = _cached_sizes(cache, rel_dir, mtime_ns)
+        sizes: dict[str, int] = {}
+        with it:
+            for entry in it:
+                rel_path = prefix + entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(rel_path)
+                    with contextlib.suppress(OSError):
+                        st = entry.stat()
+                        if (st.st_dev, st.st_ino) not in visited:
+                            visited.add((st.st_dev, st.st_ino))
+                            stack.append((Path(entry.path), rel_path + "/", st.st_mtime_ns))
+                    continue
+                size = cached_sizes.get(entry.name)
+                if not isinstance(size, int):
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = 0
+                sizes[entry.name] = size
+                files.append((rel_path, size))
+        if record is not None:
+            record[rel_dir] = {"mtime_ns": mtime_ns, "sizes": sizes}
+    return _ScanContext(root, files, dirs)
+
+
+def _cached_sizes(cache: dict[str, Any] | None, rel_dir: str, mtime_ns: int) -> dict[str, Any]:
+    """File sizes cached for `rel_dir`, or {} if absent, stale or malformed."""
+    entry = cache.get(rel_dir) if cache else None
+    if not isinstance(entry, dict) or entry.get("mtime_ns") != mtime_ns:
+        return {}
+    sizes = entry.get("sizes")
+    return sizes if isinstance(sizes, dict) else {}
+
+
+def _cache_path(root: Path) -> Path:
+    """Cache file for the dataset at `root`, keyed by its resolved path."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]
+    return Path(base) / _CACHE_SUBDIR / f"{key}.json"
+
+
+def _load_cache(root: Path) -> dict[str, Any]:
+    """Load per-directory scan entries from the cache file (empty if missing or stale)."""
+    from .. import __version__
+
+    try:
+        data = json.loads(_cache_path(root).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != __version__:
+        return {}
+    dirs = data.get("dirs")
+    return dirs if isinstance(dirs, dict) else {}
+
+
+def _save_cache(root: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """Persist per-directory scan entries. An unwritable cache dir is silently skipped."""
+    from .. import __version__
+
+    path = _cache_path(root)
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"version": __version__, "dirs": entries}))
+
+
+def check_zero_byte_files(bids_root: Path, use_cache: bool = False) -> tuple[int, list[str]]:
     """
     CRITICAL: Fast detection of zero-byte NIfTI files (common corruption indicator).
 
+    Args:
+        bids_root: Dataset root to scan recursively for *.nii.gz files.
+        use_cache: If True, persist file sizes per directory in a cache file under
+            `$XDG_CACHE_HOME/bids_hub/` (default `~/.cache`), keyed by the resolved
+            root path, and skip re-stat'ing files in directories whose mtime is
+            unchanged since the last run. Nothing is written into the dataset.
+            Directory mtime only changes when entries are added/removed/renamed,
+            so files rewritten in place are not re-checked until the cache is deleted.
+
     Returns:
         (count of zero-byte files, list of relative paths)
     """
-    zero_byte_files = []
-    for nifti in bids_root.rglob("*.nii.gz"):
-        # stat().st_size is fast (no read)
-        if nifti.stat().st_size == 0:
-            zero_byte_files.append(str(nifti.relative_to(bids_root)))
-    return len(zero_byte_files), zero_byte_files
+    if not use_cache:
+        found = _zero_byte_files(_scan_tree(bids_root))
+        return len(found), found
+
+    entries: dict[str, dict[str, Any]] = {}
+    found = _zero_byte_files(_scan_tree(bids_root, _load_cache(bids_root), record=entries))
+    _save_cache(bids_root, entries)
+    return len(found), found
+
+
+def _zero_byte_files(scan: _ScanContext) -> list[str]:
+    """Relative paths of zero-byte *.nii.gz files in a scanned tree."""
+    return [f for f, size in scan.files if size == 0 and f.endswith(".nii.gz")]
+
+
+def _check_gzip_trailer(path: Path) -> bool:
+    """Cheap structural check of a gzip file without decompressing it.
+
+    Reads only the 2-byte magic number and the 8-byte trailer (CRC32 + ISIZE).
+    Catches non-gzip content and files truncated below a minimal gzip member.
+    ISIZE is the uncompressed size mod 2**32, so a zero ISIZE (an empty member,
+    or one of exactly k * 4 GiB) is settled by decoding the first bytes. The CRC
+    itself is not verified.
+    """
+    try:
+        with path.open("rb") as f:
+            if f.read(2) != _GZIP_MAGIC:
+                return False
+            if f.seek(0, os.SEEK_END) < _GZIP_MIN_SIZE:
+                return False
+            f.seek(-8, os.SEEK_END)
+            _crc32, isize = struct.unpack("<II", f.read(8))
+    except OSError:
+        return False
+    return isize > 0 or _gzip_has_data(path)
+
+
+def _gzip_has_data(path: Path) -> bool:
+    """True if the gzip stream at `path` decodes to at least one byte."""
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        with path.open("rb") as f:
+            while chunk := f.read(1 << 16):
+                if decoder.decompress(chunk, 1):
+                    return True
+                if decoder.eof:
+                    return False
+    except (OSError, zlib.error):
+        return False
+    return False
+
+
+def check_gzip_trailers(bids_root: Path) -> tuple[int, list[str]]:
+    """
+    Quick integrity pass over *.nii.gz files (constant-time per file).
 
+    Zero-byte files are skipped here; they are reported by check_zero_byte_files.
 
-def verify_md5(archive_path: Path, expected_md5: str) -> ValidationCheck:
+    Returns:
+        (count of malformed gzip files, list of relative paths)
+    """
+    bad_files = _malformed_gzip_files(_scan_tree(bids_root))
+    return len(bad_files), bad_files
+
+
+def _malformed_gzip_files(scan: _ScanContext) -> list[str]:
+    """Relative paths of non-empty *.nii.gz files in a scanned tree that fail the trailer check."""
+    return [
+        f
+        for f, size in scan.files
+        if size > 0 and f.endswith(".nii.gz") and not _check_gzip_trailer(scan.root / f)
+    ]
+
+
+def _md5_file(path: Path) -> str:
+    """Hex MD5 of a file, hashed in C without a Python-level chunk loop."""
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "md5").hexdigest()
+        # Python 3.10: hash a read-only mapping in one call (mmap rejects empty files)
+        if os.fstat(f.fileno()).st_size == 0:
+            return _EMPTY_MD5
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.md5(mm).hexdigest()
+
+
+def _md5_file_pipelined(path: Path, chunk_size: int = 64 << 20) -> str:
+    """Hex MD5 of a file, reading the next chunk while the current one is hashed.
+
+    MD5 is strictly sequential, so a published whole-file checksum cannot be
+    split across cores; what can run concurrently is the read of chunk N+1 and
+    the hash of chunk N (both release the GIL). Files no larger than one chunk
+    go through _md5_file.
+    """
+    if path.stat().st_size <= chunk_size:
+        return _md5_file(path)
+    hash_md5 = hashlib.md5()
+    with path.open("rb") as f, ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(f.read, chunk_size)
+        while chunk := pending.result():
+            pending = pool.submit(f.read, chunk_size)
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+
+def verify_md5(
+    archive_path: Path,
+    expected_md5: str,
+    use_cache: bool = False,
+    parallel: bool = False,
+) -> ValidationCheck:
     """
     Verify MD5 checksum of an archive file.
 
+    Computed hashes are remembered for the rest of the process by file identity,
+    so a hardlinked or symlinked mirror of an already-verified archive is not
+    read again.
+
     Args:
         archive_path: Path to archive (e.g., train.7z)
         expected_md5: Expected MD5 hash string
+        use_cache: If True, store the computed hash in a `<archive>.md5.cache`
+            sidecar and reuse it while the archive's size and mtime are unchanged.
+        parallel: If True, overlap reading and hashing in 64 MiB chunks. Helps
+            on fast disks where a single-threaded read-then-hash loop is the
+            bottleneck; the result is the same whole-file MD5.
 
     Returns:
         ValidationCheck with pass/fail and computed hash
     """
-    if not archive_path.exists():
+    sidecar = archive_path.with_name(archive_path.name + ".md5.cache")
+    try:
+        # A single stat detects a missing file, an empty one, and keys the cache
+        st = archive_path.stat()
+        key = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        identity = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+        computed_md5 = _EMPTY_MD5 if st.st_size == 0 else _MD5_MEMO.get(identity)
+        if computed_md5 is None and use_cache:
+            with contextlib.suppress(OSError, ValueError):
+                cached = json.loads(sidecar.read_text())
+                if isinstance(cached, dict) and {k: cached.get(k) for k in key} == key:
+                    computed_md5 = cached.get("md5")
+        if not isinstance(computed_md5, str):
+            computed_md5 = (_md5_file_pipelined if parallel else _md5_file)(archive_path)
+            if use_cache:
+                with contextlib.suppress(OSError):
+                    sidecar.write_text(json.dumps({**key, "md5": computed_md5}))
+            _MD5_MEMO[identity] = computed_md5
+    except FileNotFoundError:
         return ValidationCheck(
             name=f"md5_{archive_path.name}",
             expected="file exists",
             actual="MISSING",
             passed=False,
         )
-
-    hash_md5 = hashlib.md5()
-    # Read in chunks to handle large files
-    try:
-        with archive_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        computed_md5 = hash_md5.hexdigest()
     except OSError as e:
         return ValidationCheck(
             name=f"md5_{archive_path.name}",
@@ -201,12 +506,35 @@ def verify_md5(archive_path: Path, expected_md5: str) -> ValidationCheck:
     )
 
 
+def verify_md5_async(
+    archive_path: Path,
+    expected_md5: str,
+    executor: Executor,
+    use_cache: bool = False,
+    parallel: bool = False,
+) -> Future[ValidationCheck]:
+    """
+    Submit verify_md5 to `executor` and return its future.
+
+    Lets a caller hash an archive while it runs directory-walk checks, paying
+    roughly max(hash, walk) instead of their sum. Hashing releases the GIL, so a
+    ThreadPoolExecutor is enough.
+
+    Returns:
+        Future resolving to the same ValidationCheck verify_md5 would return
+    """
+    return executor.submit(
+        verify_md5, archive_path, expected_md5, use_cache=use_cache, parallel=parallel
+    )
+
+
 def _check_nifti_integrity(
     bids_root: Path,
     pattern: str = "*_T1w.nii.gz",
     sample_size: int = 10,
+    scan: _ScanContext | None = None,
 ) -> ValidationCheck:
-    """Generic NIfTI spot-check."""
+    """Generic NIfTI spot-check. Pass `scan` to pick files from an existing walk."""
     try:
         import nibabel as nib
         from nibabel.filebasedimages import ImageFileError
@@ -218,10 +546,11 @@ def _check_nifti_integrity(
             passed=False,
         )
 
-    files = list(bids_root.rglob(pattern))
+    rglob = scan.rglob if scan is not None else lambda p: list(bids_root.rglob(p))
+    files = rglob(pattern)
     if not files:
         # If no files match generic pattern (T1w), try finding ANY nifti
-        files = list(bids_root.rglob("*.nii.gz"))
+        files = rglob("*.nii.gz")
         if not files:
             return ValidationCheck(
                 name="nifti_integrity",
@@ -233,11 +562,17 @@ def _check_nifti_integrity(
     sample = random.sample(files, min(sample_size, len(files)))
     failed_file: Path | None = None
 
+    def _load_header(f: Path) -> None:
+        _ = nib.load(f).header
+
     try:
-        for f in sample:
-            failed_file = f
-            img = nib.load(f)
-            _ = img.header
+        # Header reads are I/O-bound and independent, so overlap them in threads.
+        # map() yields in sample order, so the first failure reported is deterministic.
+        with ThreadPoolExecutor(max_workers=max(1, min(len(sample), 16))) as pool:
+            results = pool.map(_load_header, sample)
+            for f in sample:
+                failed_file = f
+                next(results)
         return ValidationCheck(
             name="nifti_integrity",
             expected="loadable",
@@ -254,15 +589,32 @@ def _check_nifti_integrity(
         )
 
 
+def _bids_validator_command(bids_root: Path) -> list[str] | None:
+    """Return the external BIDS validator invocation, or None if no runner is installed.
+
+    Prefers Deno (the validator's recommended runtime, no per-run package download)
+    and falls back to npx.
+    """
+    if shutil.which("deno"):
+        return ["deno", "run", "-A", "jsr:@bids/validator", str(bids_root)]
+    if shutil.which("npx"):
+        return ["npx", "--yes", "bids-validator", str(bids_root)]
+    return None
+
+
 def _check_bids_validator(bids_root: Path) -> ValidationCheck | None:
     """Run external BIDS validator if available (optional)."""
-    if not shutil.which("npx"):
+    command = _bids_validator_command(bids_root)
+    if command is None:
         return None
 
     try:
+        # Only the exit code and a short stderr excerpt are reported, so discard
+        # stdout instead of buffering the full report (tens of MB on large datasets).
         result = subprocess.run(
-            ["npx", "--yes", "bids-validator", str(bids_root), "--json"],
-            capture_output=True,
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=300,
         )
@@ -288,34 +640,143 @@ def _check_bids_validator(bids_root: Path) -> ValidationCheck | None:
         return None  # Validator errored, skip check
 
 
-def _count_sessions_with_modality(bids_root: Path, pattern: str) -> int:
-    """Generic session counter."""
-    count = 0
-    # Assume BIDS structure: sub-*/ses-*/.../pattern or sub-*/.../pattern
-    # For robust session counting, we find all ses-* dirs (or sub-* if no sessions)
-    # that contain the file.
-    # Simplest generic approach: Find all FILES, then count unique parent subjects/sessions.
-    # But ISLES24 is flat (no ses- folders).
-    # ARC is ses- based.
-    # Robust approach: glob files, extract parent folder structure.
-    # But for BIDS, "session" concept varies.
-    # Let's stick to the ARC implementation logic for now, but generalized?
-    # Actually, for ISLES24 (flat), each subject is essentially 1 session.
-    # So iterating subjects is safer.
-
-    # Check if sessions exist
-    sessions = list(bids_root.glob("sub-*/ses-*"))
-    if sessions:
-        # Session-based
-        for session_dir in sessions:
-            if list(session_dir.rglob(pattern)):
-                count += 1
-    else:
-        # Subject-based (flat or no ses- dirs)
-        for subject_dir in bids_root.glob("sub-*"):
-            if list(subject_dir.rglob(pattern)):
-                count += 1
-    return count
+@functools.cache
+def _glob_to_regex(pattern: str, recursive: bool = False) -> re.Pattern[str]:
+    """Compile a relative path glob to a full-match regex, with `Path.glob` semantics.
+
+    Supports `*`, `?` and `[...]`/`[!...]` within a path segment (none of them
+    cross `/`) and `**` as a whole segment matching zero or more directories.
+    With `recursive=True` the pattern may match at any depth, like `Path.rglob`.
+
+    Raises:
+        ValueError: For an empty or absolute pattern, or a trailing `**` (which
+            pathlib only matches against directories, never files).
+    """
+    if not pattern or pattern.startswith("/"):
+        raise ValueError(f"Unsupported glob pattern {pattern!r}: must be relative")
+    segments = pattern.split("/")
+    if segments[-1] == "**":
+        raise ValueError(f"Unsupported glob pattern {pattern!r}: trailing '**' matches no files")
+    regex = "(?:.*/)?" if recursive else ""
+    for segment in segments[:-1]:
+        regex += "(?:[^/]+/)*" if segment == "**" else _glob_segment_to_regex(segment) + "/"
+    return re.compile(regex + _glob_segment_to_regex(segments[-1]), re.DOTALL)
+
+
+def _glob_segment_to_regex(segment: str) -> str:
+    """Translate one glob path segment like `fnmatch.translate`, without crossing `/`."""
+    out = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            # Find the closing bracket; a leading `!` or `]` belongs to the class
+            j = i + 1 if i < n and segment[i] == "!" else i
+            j = segment.find("]", j + 1 if j < n and segment[j] == "]" else j)
+            if j == -1:
+                out.append(re.escape(c))  # unclosed: a literal "["
+                continue
+            body, i = segment[i:j], j + 1
+            negate = body.startswith("!")
+            # Escape regex-significant characters but keep `-` ranges
+            body = re.sub(r"([\\\]\[^&~|])", r"\\\1", body[1:] if negate else body)
+            out.append(f"[^/{body}]" if negate else f"[{body}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _any_of(regexes: Iterable[re.Pattern[str]]) -> re.Pattern[str]:
+    """One regex that full-matches whatever any of `regexes` would.
+
+    Used to reject non-matching names with a single call. Overlapping patterns
+    are each counted, so a hit is still classified against every regex.
+    """
+    return re.compile("|".join(f"(?:{regex.pattern})" for regex in regexes), re.DOTALL)
+
+
+def _count_sessions_with_modalities(
+    bids_root: Path, patterns: dict[str, str], scan: _ScanContext | None = None
+) -> dict[str, int]:
+    """Generic session counter for several modality patterns at once.
+
+    Counts sub-*/ses-* directories (or sub-* directories when the dataset has no
+    sessions) containing at least one file matching each pattern at any depth.
+    Every file of a single tree walk (`scan`, or a fresh one) is assigned to its
+    session and classified against all compiled patterns.
+    """
+    if scan is None:
+        scan = _scan_tree(bids_root)
+    compiled = {
+        modality: _glob_to_regex(pattern, recursive=True) for modality, pattern in patterns.items()
+    }
+
+    # Session-based when ses-* dirs exist, else subject-based (flat or no ses- dirs)
+    session_regex = _glob_to_regex("sub-*/ses-*")
+    depth = 2 if any(session_regex.fullmatch(d) for d in scan.dirs) else 1
+    unit_regex = session_regex if depth == 2 else _glob_to_regex("sub-*")
+
+    any_modality = _any_of(compiled.values())
+
+    found: dict[str, set[str]] = {modality: set() for modality in patterns}
+    for rel_path, _size in scan.files:
+        parts = rel_path.split("/", depth)
+        if len(parts) <= depth:
+            continue  # not inside a session/subject directory
+        if not any_modality.fullmatch(parts[depth]):
+            continue
+        unit = "/".join(parts[:depth])
+        if not unit_regex.fullmatch(unit):
+            continue
+        for modality, regex in compiled.items():
+            if regex.fullmatch(parts[depth]):
+                found[modality].add(unit)
+    return {modality: len(units) for modality, units in found.items()}
+
+
+def _check_required_files(bids_root: Path, required_files: list[str]) -> ValidationCheck:
+    """Check that every path in `required_files` exists under `bids_root`.
+
+    Top-level names are looked up in one directory listing; nested paths are stat'ed.
+    """
+    top_level: set[str] = set()
+    with contextlib.suppress(OSError), os.scandir(bids_root) as it:
+        top_level = {entry.name for entry in it}
+    missing_req = [
+        f
+        for f in required_files
+        if (f not in top_level if "/" not in f else not (bids_root / f).exists())
+    ]
+    return ValidationCheck(
+        name="required_files",
+        expected="all present",
+        actual=f"missing: {len(missing_req)}" if missing_req else "all present",
+        passed=len(missing_req) == 0,
+        details=f"Missing: {', '.join(missing_req)}" if missing_req else "",
+    )
+
+
+def _count_subject_dirs(directory: Path) -> int:
+    """Count `sub-*` entries directly under `directory` (one listing, no recursion)."""
+    with os.scandir(directory) as it:
+        return sum(1 for entry in it if entry.name.startswith("sub-"))
+
+
+def _skipped_check(name: str) -> ValidationCheck:
+    """Placeholder for an expensive check not run because a cheap precondition failed."""
+    return ValidationCheck(
+        name=name,
+        expected="run",
+        actual="not run",
+        passed=True,
+        skipped=True,
+        details="skipped: precondition failed",
+    )
 
 
 def validate_dataset(
@@ -324,9 +785,15 @@ def validate_dataset(
     run_bids_validator: bool = False,
     nifti_sample_size: int = 10,
     tolerance: float = 0.0,
+    fail_fast: bool = False,
 ) -> ValidationResult:
     """
     Generic validation using dataset-specific config.
+
+    Required files and the top-level subject count are checked before the tree
+    walk. With `fail_fast=True`, if either fails, validation stops there: the
+    zero-byte, gzip and NIfTI checks are reported as skipped, and the session and
+    modality counts, custom checks and BIDS validator are not run.
     """
     bids_root = Path(bids_root).resolve()
     result = ValidationResult(bids_root=bids_root)
@@ -342,8 +809,24 @@ def validate_dataset(
         )
         return result
 
-    # 1. Zero-byte check (Fail fast)
-    zero_count, zero_files = check_zero_byte_files(bids_root)
+    # Required files and subject count (top-level listings only)
+    cheap = [_check_required_files(bids_root, config.required_files)]
+    if "subjects" in config.expected_counts:
+        expected = config.expected_counts["subjects"]
+        cheap.append(check_count("subjects", _count_subject_dirs(bids_root), expected, tolerance))
+    if fail_fast and not all(c.passed for c in cheap):
+        for c in cheap:
+            result.add(c)
+        for name in ("zero_byte_files", "gzip_integrity", "nifti_integrity"):
+            result.add(_skipped_check(name))
+        return result
+
+    # Every tree-wide check below reads this one walk instead of re-listing the tree
+    scan = _scan_tree(bids_root)
+
+    # 1. Zero-byte and gzip framing checks (Fail fast)
+    zero_files = _zero_byte_files(scan)
+    zero_count = len(zero_files)
     result.add(
         ValidationCheck(
             name="zero_byte_files",
@@ -353,49 +836,46 @@ def validate_dataset(
             details=f"First 5: {', '.join(zero_files[:5])}" if zero_count > 0 else "",
         )
     )
-
-    # 2. Required files
-    missing_req = [f for f in config.required_files if not (bids_root / f).exists()]
+    bad_files = _malformed_gzip_files(scan)
+    bad_count = len(bad_files)
     result.add(
         ValidationCheck(
-            name="required_files",
-            expected="all present",
-            actual=f"missing: {len(missing_req)}" if missing_req else "all present",
-            passed=len(missing_req) == 0,
-            details=f"Missing: {', '.join(missing_req)}" if missing_req else "",
+            name="gzip_integrity",
+            expected="0 malformed",
+            actual=str(bad_count),
+            passed=bad_count == 0,
+            details=f"First 5: {', '.join(bad_files[:5])}" if bad_count > 0 else "",
         )
     )
 
-    # 3. Counts (Subjects/Sessions/Modalities)
-    # Handle "subjects" and "sessions" specifically if in config
-    if "subjects" in config.expected_counts:
-        # Count sub-* directories
-        actual = len(list(bids_root.glob("sub-*")))
-        expected = config.expected_counts["subjects"]
-        # Use simple count check with tolerance logic
-        result.add(check_count("subjects", actual, expected, tolerance))
+    # 2. Required files, 3. Counts (Subjects/Sessions/Modalities)
+    for c in cheap:
+        result.add(c)
 
     if "sessions" in config.expected_counts:
         # Count sub-*/ses-* directories
-        actual = len(list(bids_root.glob("sub-*/ses-*")))
+        actual = scan.glob_count("sub-*/ses-*")
         expected = config.expected_counts["sessions"]
         result.add(check_count("sessions", actual, expected, tolerance))
 
-    # Modality counts
-    for modality, pattern in config.modality_patterns.items():
-        if modality in config.expected_counts:
-            # Use the generic counter
-            actual = _count_sessions_with_modality(bids_root, pattern)
-            expected = config.expected_counts[modality]
-            result.add(check_count(f"{modality}_count", actual, expected, tolerance))
-        # Note: If key matches config.expected_counts but not in patterns, it's skipped here.
+    # Modality counts (every pattern classified in one pass over the scan)
+    # Note: If key matches config.expected_counts but not in patterns, it's skipped here.
+    counted_patterns = {
+        modality: pattern
+        for modality, pattern in config.modality_patterns.items()
+        if modality in config.expected_counts
+    }
+    modality_counts = _count_sessions_with_modalities(bids_root, counted_patterns, scan)
+    for modality, actual in modality_counts.items():
+        expected = config.expected_counts[modality]
+        result.add(check_count(f"{modality}_count", actual, expected, tolerance))
 
     # 4. Custom Checks
     for check_func in config.custom_checks:
         result.add(check_func(bids_root))
 
     # 5. NIfTI Integrity
-    result.add(_check_nifti_integrity(bids_root, sample_size=nifti_sample_size))
+    result.add(_check_nifti_integrity(bids_root, sample_size=nifti_sample_size, scan=scan))
 
     # 6. Optional BIDS Validator
     if run_bids_validator:
@@ -12,9 +12,11 @@ Architecture follows Single Responsibility Principle:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
 
@@ -23,8 +25,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Separator line used in HFValidationResult.summary()
+_RULE = "=" * 60
 
-@dataclass
+# Check name for each _scan_hf_columns reduction, shared by every count helper below
+_CHECK_NAME_FORMATS = {
+    "unique": "{column}_unique",
+    "non_null": "{column}_non_null",
+    "list_sessions": "{column}_sessions",
+    "list_total": "{column}_total",
+}
+
+
+def _arrow_table(ds: Dataset | pa.Table) -> pa.Table:
+    """Return the backing Arrow table of a Dataset (or the table itself).
+
+    Callers running many checks should pass `ds.data.table` once instead of the
+    Dataset so every helper reads from the same materialized table.
+    """
+    if isinstance(ds, pa.Table):
+        return ds
+    return ds.data.table
+
+
+@dataclass(slots=True)
 class HFValidationCheck:
     """Result of a single HuggingFace dataset validation check.
 
@@ -43,7 +67,7 @@ class HFValidationCheck:
     details: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HFValidationResult:
     """Complete validation result for a HuggingFace dataset.
 
@@ -71,19 +95,9 @@ class HFValidationResult:
 
     def summary(self) -> str:
         """Human-readable summary of validation results."""
-        lines = [
-            f"HuggingFace Validation Results for: {self.dataset_name}",
-            "=" * 60,
-        ]
-        for check in self.checks:
-            status = "✅ PASS" if check.passed else "❌ FAIL"
-            lines.append(f"{status} {check.name}")
-            if not check.passed:
-                lines.append(f"       Expected: {check.expected}")
-                lines.append(f"       Actual:   {check.actual}")
-                if check.details:
-                    lines.append(f"       Details:  {check.details}")
-        lines.append("=" * 60)
+        lines = [f"HuggingFace Validation Results for: {self.dataset_name}", _RULE]
+        lines.extend(_format_hf_check(check) for check in self.checks)
+        lines.append(_RULE)
         if self.passed:
             lines.append("✅ All validations passed! HF dataset matches SSOT.")
         else:
@@ -91,32 +105,45 @@ class HFValidationResult:
         return "\n".join(lines)
 
 
+def _format_hf_check(check: HFValidationCheck) -> str:
+    """Render one check as its (possibly multi-line) summary block."""
+    if check.passed:
+        return f"✅ PASS {check.name}"
+    block = (
+        f"❌ FAIL {check.name}\n       Expected: {check.expected}\n       Actual:   {check.actual}"
+    )
+    if check.details:
+        block += f"\n       Details:  {check.details}"
+    return block
+
+
 # --- Generic validation helper functions ---
 
 
 def check_schema(
-    ds: Dataset,
+    ds: Dataset | pa.Table,
     expected_columns: list[str],
 ) -> HFValidationCheck:
     """Verify dataset has expected columns.
 
     Args:
-        ds: HuggingFace Dataset to check.
+        ds: HuggingFace Dataset (or its Arrow table) to check.
         expected_columns: List of expected column names.
 
     Returns:
         HFValidationCheck with pass/fail status.
     """
-    actual_cols = list(ds.column_names)
+    actual_cols = set(ds.column_names)
+    expected_cols = set(expected_columns)
 
-    missing = set(expected_columns) - set(actual_cols)
-    extra = set(actual_cols) - set(expected_columns)
+    missing = expected_cols - actual_cols
+    extra = actual_cols - expected_cols
 
     if not missing and not extra:
         return HFValidationCheck(
             name="schema",
             expected=f"{len(expected_columns)} columns",
-            actual=f"{len(actual_cols)} columns",
+            actual=f"{len(ds.column_names)} columns",
             passed=True,
         )
 
@@ -129,17 +156,17 @@ def check_schema(
     return HFValidationCheck(
         name="schema",
         expected=f"{len(expected_columns)} columns",
-        actual=f"{len(actual_cols)} columns",
+        actual=f"{len(ds.column_names)} columns",
         passed=False,
         details="; ".join(details),
     )
 
 
-def check_row_count(ds: Dataset, expected: int) -> HFValidationCheck:
+def check_row_count(ds: Dataset | pa.Table, expected: int) -> HFValidationCheck:
     """Verify dataset has expected number of rows.
 
     Args:
-        ds: HuggingFace Dataset to check.
+        ds: HuggingFace Dataset (or its Arrow table) to check.
         expected: Expected row count.
 
     Returns:
@@ -154,8 +181,110 @@ def check_row_count(ds: Dataset, expected: int) -> HFValidationCheck:
     )
 
 
+def _scan_hf_columns(
+    ds: Dataset | pa.Table,
+    spec: dict[str, list[str]],
+) -> dict[tuple[str, str], int]:
+    """Compute several column reductions in a single pass over the Arrow table.
+
+    Supported reductions:
+    - "unique": number of distinct values
+    - "non_null": number of non-null values
+    - "list_sessions": rows whose list has at least one item
+    - "list_total": total items across all lists
+
+    List reductions on the same column share one `list_value_length` kernel call.
+
+    Args:
+        ds: HuggingFace Dataset (or its Arrow table) to scan.
+        spec: Mapping of column name to the reductions to compute on it.
+
+    Returns:
+        Mapping of (column, reduction) to the computed count.
+
+    Raises:
+        ValueError: If an unknown reduction is requested.
+    """
+    table = _arrow_table(ds)
+    values: dict[tuple[str, str], int] = {}
+    for column, reductions in spec.items():
+        col = table.column(column)
+        lengths: pa.Array | None = None
+        for reduction in reductions:
+            if reduction == "unique":
+                # Count without materializing the distinct values; mode="all"
+                # counts null as a value, like len(pc.unique(...)) did.
+                try:
+                    distinct = pc.count_distinct(col, mode="all").as_py()
+                except pa.ArrowNotImplementedError:
+                    # e.g. dictionary-encoded columns have no count_distinct kernel
+                    distinct = len(pc.unique(col))
+                values[(column, reduction)] = distinct
+            elif reduction == "non_null":
+                values[(column, reduction)] = len(col) - col.null_count
+            elif reduction in ("list_sessions", "list_total"):
+                # Null lists yield null lengths, which pc.sum skips (no fill_null pass)
+                if lengths is None:
+                    lengths = pc.list_value_length(col)
+                if reduction == "list_sessions":
+                    # Arrow sums booleans directly as integers
+                    total = pc.sum(pc.greater(lengths, 0)).as_py()
+                else:
+                    total = pc.sum(lengths).as_py()
+                values[(column, reduction)] = total or 0
+            else:
+                raise ValueError(f"Unknown reduction {reduction!r} for column {column!r}")
+    return values
+
+
+def _count_check(name: str, actual: int, expected: int) -> HFValidationCheck:
+    """Build an exact-match count check."""
+    return HFValidationCheck(
+        name=name,
+        expected=str(expected),
+        actual=str(actual),
+        passed=actual == expected,
+    )
+
+
+def _check_name(column: str, reduction: str) -> str:
+    """Default name of the count check for `reduction` on `column`."""
+    return _CHECK_NAME_FORMATS[reduction].format(column=column)
+
+
+def check_column_counts(
+    ds: Dataset | pa.Table,
+    expected: Iterable[tuple[str, str, int]],
+) -> list[HFValidationCheck]:
+    """Run several exact-count column checks from one `_scan_hf_columns` call.
+
+    Each check is named as the single-column helper would name it, e.g.
+    ("t1w", "list_total", n) gives the same check as check_total_list_items.
+
+    Args:
+        ds: HuggingFace Dataset (or its Arrow table) to check.
+        expected: (column, reduction, expected count) triples, with reductions
+            "unique", "non_null", "list_sessions" or "list_total".
+
+    Returns:
+        One HFValidationCheck per triple, in the given order.
+
+    Raises:
+        ValueError: If an unknown reduction is requested.
+    """
+    expected = list(expected)
+    spec: dict[str, list[str]] = {}
+    for column, reduction, _ in expected:
+        spec.setdefault(column, []).append(reduction)
+    scan = _scan_hf_columns(ds, spec)
+    return [
+        _count_check(_check_name(column, reduction), scan[(column, reduction)], count)
+        for column, reduction, count in expected
+    ]
+
+
 def check_unique_values(
-    ds: Dataset,
+    ds: Dataset | pa.Table,
     column: str,
     expected: int,
     check_name: str | None = None,
@@ -163,7 +292,7 @@ def check_unique_values(
     """Count unique values in a column.
 
     Args:
-        ds: HuggingFace Dataset to check.
+        ds: HuggingFace Dataset (or its Arrow table) to check.
         column: Column name to count unique values.
         expected: Expected count of unique values.
         check_name: Optional custom check name (defaults to "{column}_unique").
@@ -171,96 +300,71 @@ def check_unique_values(
     Returns:
         HFValidationCheck with pass/fail status.
     """
-    values = ds.data.table.column(column).combine_chunks()
-    actual = len(pc.unique(values))
-    return HFValidationCheck(
-        name=check_name or f"{column}_unique",
-        expected=str(expected),
-        actual=str(actual),
-        passed=actual == expected,
-    )
+    actual = _scan_hf_columns(ds, {column: ["unique"]})[(column, "unique")]
+    return _count_check(check_name or _check_name(column, "unique"), actual, expected)
 
 
 def check_non_null_count(
-    ds: Dataset,
+    ds: Dataset | pa.Table,
     column: str,
     expected: int,
 ) -> HFValidationCheck:
     """Count non-null values in a column.
 
     Args:
-        ds: HuggingFace Dataset to check.
+        ds: HuggingFace Dataset (or its Arrow table) to check.
         column: Column name to count non-null values.
         expected: Expected count of non-null values.
 
     Returns:
         HFValidationCheck with pass/fail status.
     """
-    col = ds.data.table.column(column)
-    non_null = len(col) - col.null_count
-    return HFValidationCheck(
-        name=f"{column}_non_null",
-        expected=str(expected),
-        actual=str(non_null),
-        passed=non_null == expected,
-    )
+    non_null = _scan_hf_columns(ds, {column: ["non_null"]})[(column, "non_null")]
+    return _count_check(_check_name(column, "non_null"), non_null, expected)
 
 
 def check_list_sessions(
-    ds: Dataset,
+    ds: Dataset | pa.Table,
     column: str,
     expected: int,
 ) -> HFValidationCheck:
     """Count rows with at least one item in a list column.
 
     Args:
-        ds: HuggingFace Dataset to check.
+        ds: HuggingFace Dataset (or its Arrow table) to check.
         column: Column name containing lists.
         expected: Expected count of rows with non-empty lists.
 
     Returns:
         HFValidationCheck with pass/fail status.
     """
-    col = ds.data.table.column(column)
-    lengths = pc.fill_null(pc.list_value_length(col), 0)
-    has_data = pc.greater(lengths, 0)
-    sessions_with_data = pc.sum(pc.cast(has_data, pa.int64())).as_py() or 0
-    return HFValidationCheck(
-        name=f"{column}_sessions",
-        expected=str(expected),
-        actual=str(sessions_with_data),
-        passed=sessions_with_data == expected,
-    )
+    sessions_with_data = _scan_hf_columns(ds, {column: ["list_sessions"]})[
+        (column, "list_sessions")
+    ]
+    return _count_check(_check_name(column, "list_sessions"), sessions_with_data, expected)
 
 
 def check_total_list_items(
-    ds: Dataset,
+    ds: Dataset | pa.Table,
     column: str,
     expected: int,
 ) -> HFValidationCheck:
     """Count total items across all lists in a column.
 
     Args:
-        ds: HuggingFace Dataset to check.
+        ds: HuggingFace Dataset (or its Arrow table) to check.
         column: Column name containing lists.
         expected: Expected total count of items.
 
     Returns:
         HFValidationCheck with pass/fail status.
     """
-    col = ds.data.table.column(column)
-    lengths = pc.fill_null(pc.list_value_length(col), 0)
-    total = pc.sum(lengths).as_py() or 0
-    return HFValidationCheck(
-        name=f"{column}_total",
-        expected=str(expected),
-        actual=str(total),
-        passed=total == expected,
-    )
+    total = _scan_hf_columns(ds, {column: ["list_total"]})[(column, "list_total")]
+    return _count_check(_check_name(column, "list_total"), total, expected)
 
 
 def check_list_alignment(
-    ds: Dataset,
+    ds: Dataset | pa.Table,
     columns: list[str],
     row_id_columns: list[str] | None = None,
     sample_limit: int = 5,
@@ -270,55 +374,55 @@ def check_list_alignment(
     Useful for aligned data like DWI + bvals + bvecs.
 
     Args:
-        ds: HuggingFace Dataset to check.
+        ds: HuggingFace Dataset (or its Arrow table) to check.
         columns: List of column names that should be aligned.
         row_id_columns: Optional columns used to identify rows in error output
             (e.g., ["subject_id", "session_id"]).
-        sample_limit: Max number of misaligned rows to report.
+        sample_limit: Max number of misaligned rows to describe in details.
 
     Returns:
         HFValidationCheck with pass/fail status.
     """
-    table = ds.data.table
-    row_count = len(ds)
-    length_lists = []
-    for col_name in columns:
-        col = table.column(col_name)
-        lengths = pc.fill_null(pc.list_value_length(col), 0)
-        length_lists.append(lengths.to_pylist())
-
-    row_ids: dict[str, list[object]] = {}
-    if row_id_columns:
-        for col_name in row_id_columns:
-            if col_name in table.column_names:
-                row_ids[col_name] = table.column(col_name).to_pylist()
-
-    misaligned = []
-    for i in range(row_count):
-        lengths = [col_lengths[i] for col_lengths in length_lists]
-        if len(set(lengths)) > 1:
-            pairs = zip(columns, lengths, strict=False)
-            desc = ", ".join(f"{col}={ln}" for col, ln in pairs)
-            if row_ids:
-                ids = ", ".join(f"{k}={row_ids[k][i]}" for k in row_ids)
-                misaligned.append(f"Row {i} ({ids}): {desc}")
-            else:
-                misaligned.append(f"Row {i}: {desc}")
-            if len(misaligned) >= sample_limit:
-                break
+    table = _arrow_table(ds)
+    name = f"alignment_{'+'.join(columns)}"
+    lens = [pc.fill_null(pc.list_value_length(table.column(col_name)), 0) for col_name in columns]
 
-    if not misaligned:
+    # Fast path: most datasets are aligned, so confirm that with Arrow reductions
+    # before building the per-row matrix needed to locate mismatches.
+    if all(pc.all(pc.equal(lens[0], other)).as_py() for other in lens[1:]):
         return HFValidationCheck(
-            name=f"alignment_{'+'.join(columns)}",
+            name=name,
             expected="All rows aligned",
             actual="All rows aligned",
             passed=True,
         )
 
+    # (n_cols, n_rows) matrix of list lengths; a row is misaligned when they differ
+    lengths = np.stack([col_lengths.to_numpy() for col_lengths in lens])
+    all_bad = np.flatnonzero((lengths[1:] != lengths[0]).any(axis=0))
+    bad_rows = all_bad[:sample_limit]
+
+    row_ids: dict[str, list[object]] = {}
+    if row_id_columns and len(bad_rows):
+        indices = pa.array(bad_rows)
+        for col_name in row_id_columns:
+            if col_name in table.column_names:
+                row_ids[col_name] = table.column(col_name).take(indices).to_pylist()
+
+    misaligned = []
+    for j, i in enumerate(bad_rows.tolist()):
+        pairs = zip(columns, lengths[:, i].tolist(), strict=False)
+        desc = ", ".join(f"{col}={ln}" for col, ln in pairs)
+        if row_ids:
+            ids = ", ".join(f"{k}={row_ids[k][j]}" for k in row_ids)
+            misaligned.append(f"Row {i} ({ids}): {desc}")
+        else:
+            misaligned.append(f"Row {i}: {desc}")
+
     return HFValidationCheck(
-        name=f"alignment_{'+'.join(columns)}",
+        name=name,
         expected="All rows aligned",
-        actual=f"{len(misaligned)}+ misaligned rows",
+        actual=f"{len(all_bad)} misaligned rows",
         passed=False,
         details="; ".join(misaligned[:3]),
     )
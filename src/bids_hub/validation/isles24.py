@@ -6,15 +6,26 @@ Note: ISLES24 uses non-standard BIDS structure with raw_data/, derivatives/, phe
 
 from __future__ import annotations
 
+import contextlib
+import os
+import zipfile
 from pathlib import Path
 
 from .base import (
     DatasetValidationConfig,
     ValidationCheck,
     ValidationResult,
+    _any_of,
     _check_nifti_integrity,
+    _check_required_files,
+    _count_subject_dirs,
+    _glob_to_regex,
+    _malformed_gzip_files,
+    _scan_tree,
+    _ScanContext,
+    _skipped_check,
+    _zero_byte_files,
     check_count,
-    check_zero_byte_files,
     verify_md5,
 )
 
@@ -54,6 +65,17 @@ ISLES24_MODALITY_PATTERNS = {
     "lvo_mask": "derivatives/sub-*/ses-01/*_space-ncct_lvo-msk.nii.gz",
 }
 
+# (modality, expected count) pairs checked by validate_isles24_download, and the
+# patterns they need; modalities with no expected count are not scanned.
+_ISLES24_COUNT_CHECKS: tuple[tuple[str, int], ...] = tuple(
+    (modality, ISLES24_EXPECTED_COUNTS[modality])
+    for modality in ISLES24_MODALITY_PATTERNS
+    if ISLES24_EXPECTED_COUNTS.get(modality, 0) > 0
+)
+_ISLES24_COUNTED_PATTERNS = {
+    modality: ISLES24_MODALITY_PATTERNS[modality] for modality, _ in _ISLES24_COUNT_CHECKS
+}
+
 # Configuration dataclass (primarily for documentation; custom validation is used)
 ISLES24_VALIDATION_CONFIG = DatasetValidationConfig(
     name="isles24",
@@ -66,7 +88,45 @@ ISLES24_VALIDATION_CONFIG = DatasetValidationConfig(
 )
 
 
-def check_phenotype_readable(bids_root: Path) -> ValidationCheck:
+def _find_first_xlsx(directory: Path) -> Path | None:
+    """Return the first *.xlsx under `directory`, checking shallower levels first.
+
+    Stops at the first hit instead of listing the whole tree. Directory symlinks
+    are followed like in `_scan_tree`, entering each real directory once, and
+    unreadable subdirectories are skipped. Raises FileNotFoundError/
+    NotADirectoryError if `directory` is not a directory.
+    """
+    root_st = directory.stat()
+    visited = {(root_st.st_dev, root_st.st_ino)}
+    pending = [directory]
+    while pending:
+        subdirs = []
+        for current in pending:
+            try:
+                it = os.scandir(current)
+            except OSError:
+                if current is directory:
+                    raise
+                continue  # e.g. PermissionError: skipped, as rglob does
+            with it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        with contextlib.suppress(OSError):
+                            st = entry.stat()
+                            if (st.st_dev, st.st_ino) not in visited:
+                                visited.add((st.st_dev, st.st_ino))
+                                subdirs.append(Path(entry.path))
+                    elif entry.name.endswith(".xlsx"):
+                        return Path(entry.path)
+        pending = subdirs
+    return None
+
+
+def check_phenotype_readable(bids_root: Path, deep: bool = True) -> ValidationCheck:
     """
     Spot-check that phenotype XLSX files are readable.
 
@@ -74,12 +134,17 @@ def check_phenotype_readable(bids_root: Path) -> ValidationCheck:
 
     Args:
         bids_root: Path to ISLES24 root (containing phenotype/ dir)
+        deep: If True (default), open the XLSX with openpyxl and report the
+            number of data rows. If False, only check it is a ZIP container with
+            `xl/workbook.xml`, reading just the ZIP directory.
 
     Returns:
         ValidationCheck with pass/fail/skipped status
     """
     phenotype_dir = bids_root / "phenotype"
-    if not phenotype_dir.exists():
+    try:
+        sample_xlsx = _find_first_xlsx(phenotype_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return ValidationCheck(
             name="phenotype_readable",
             expected="phenotype/ exists",
@@ -89,8 +154,7 @@ def check_phenotype_readable(bids_root: Path) -> ValidationCheck:
             details="phenotype/ directory not found - check may indicate incomplete extraction",
         )
 
-    xlsx_files = list(phenotype_dir.rglob("*.xlsx"))
-    if not xlsx_files:
+    if sample_xlsx is None:
         return ValidationCheck(
             name="phenotype_readable",
             expected="XLSX files in phenotype/",
@@ -100,15 +164,44 @@ def check_phenotype_readable(bids_root: Path) -> ValidationCheck:
             details="No XLSX files found in phenotype/ - metadata will be unavailable",
         )
 
-    try:
-        import pandas as pd
+    if not deep:
+        try:
+            with zipfile.ZipFile(sample_xlsx) as archive:
+                archive.getinfo("xl/workbook.xml")
+        except (zipfile.BadZipFile, KeyError, OSError) as e:
+            return ValidationCheck(
+                name="phenotype_readable",
+                expected="readable XLSX",
+                actual="unreadable",
+                passed=False,
+                details=f"Phenotype XLSX unreadable: {e}",
+            )
+        return ValidationCheck(
+            name="phenotype_readable",
+            expected="readable XLSX",
+            actual="valid XLSX container",
+            passed=True,
+            details=f"Phenotype XLSX readable: {sample_xlsx.name}",
+        )
 
-        sample_xlsx = xlsx_files[0]
-        df = pd.read_excel(sample_xlsx)
+    try:
+        import openpyxl
+
+        # Read-only mode streams rows instead of building the full workbook model
+        wb = openpyxl.load_workbook(sample_xlsx, read_only=True, data_only=True)
+        try:
+            rows = sum(
+                1
+                for row in wb.active.iter_rows(values_only=True)
+                if any(value is not None for value in row)
+            )
+        finally:
+            wb.close()
+        n_rows = max(rows - 1, 0)  # exclude header row
         return ValidationCheck(
             name="phenotype_readable",
             expected="readable XLSX",
-            actual=f"{len(df)} rows",
+            actual=f"{n_rows} rows",
             passed=True,
             details=f"Phenotype XLSX readable: {sample_xlsx.name}",
         )
@@ -122,26 +215,51 @@ def check_phenotype_readable(bids_root: Path) -> ValidationCheck:
         )
 
 
-def _count_isles24_modality(bids_root: Path, pattern: str) -> int:
-    """Count ISLES24 modality files using full glob pattern.
+def _count_isles24_modalities(
+    bids_root: Path, patterns: dict[str, str], scan: _ScanContext | None = None
+) -> dict[str, int]:
+    """Count ISLES24 modality files for every pattern in a single directory walk.
 
     Unlike generic BIDS, ISLES24 uses raw_data/sub-* and derivatives/sub-* structure.
+    Each non-empty *.nii.gz of the walk (`scan`, or a fresh one) is classified
+    against all patterns at once.
     """
-    files = list(bids_root.glob(pattern))
-    # Only count non-zero byte files (exclude corrupted)
-    return sum(1 for f in files if f.stat().st_size > 0)
+    if scan is None:
+        scan = _scan_tree(bids_root)
+    compiled = {modality: _glob_to_regex(pattern) for modality, pattern in patterns.items()}
+    any_modality = _any_of(compiled.values())
+    counts = dict.fromkeys(patterns, 0)
+    for rel_path, size in scan.files:
+        # Only count non-zero byte files (exclude corrupted)
+        if size > 0 and rel_path.endswith(".nii.gz") and any_modality.fullmatch(rel_path):
+            for modality, regex in compiled.items():
+                if regex.fullmatch(rel_path):
+                    counts[modality] += 1
+    return counts
+
+
+def _check_isles24_dir(bids_root: Path, dirname: str) -> ValidationCheck:
+    """Check that a top-level ISLES24 directory exists."""
+    exists = (bids_root / dirname).exists()
+    return ValidationCheck(
+        name=f"dir_{dirname}",
+        expected="exists",
+        actual="exists" if exists else "MISSING",
+        passed=exists,
+    )
 
 
 def validate_isles24_download(
     bids_root: Path,
     nifti_sample_size: int = 10,
     tolerance: float = 0.1,  # 10% tolerance for optional modalities
+    fail_fast: bool = False,
 ) -> ValidationResult:
     """
     Validate an ISLES24 dataset download.
 
     This function checks:
-    1. Zero-byte file detection (fast corruption check)
+    1. Zero-byte and malformed-gzip detection (fast corruption checks)
     2. Required files exist (clinical_data-description.xlsx)
     3. Required directories exist (raw_data/, derivatives/, phenotype/)
     4. Subject count in raw_data/ matches expected (~149)
@@ -156,6 +274,9 @@ def validate_isles24_download(
         bids_root: Path to the ISLES24 root directory (e.g., train/).
         nifti_sample_size: Number of NIfTI files to spot-check.
         tolerance: Allowed missing fraction (0.0 to 1.0). Default 0.1 (10%).
+        fail_fast: If True and a required file, directory or the subject count
+            check fails, stop before the tree walk: the zero-byte, gzip and NIfTI
+            checks are reported as skipped; modality and phenotype checks are not run.
 
     Returns:
         ValidationResult with all check outcomes.
@@ -175,8 +296,33 @@ def validate_isles24_download(
         )
         return result
 
-    # Check 1: Zero-byte files (fast corruption detection)
-    zero_count, zero_files = check_zero_byte_files(bids_root)
+    # Checks 2-4 only list the top level, so they run before the tree walk
+    config = ISLES24_VALIDATION_CONFIG
+    raw_data = bids_root / "raw_data"
+    cheap = [_check_required_files(bids_root, config.required_files)]
+    cheap.extend(_check_isles24_dir(bids_root, d) for d in ("raw_data", "derivatives", "phenotype"))
+    if raw_data.is_dir():
+        cheap.append(
+            check_count(
+                "subjects",
+                _count_subject_dirs(raw_data),
+                ISLES24_EXPECTED_COUNTS["subjects"],
+                tolerance,
+            )
+        )
+    if fail_fast and not all(c.passed for c in cheap):
+        for c in cheap:
+            result.add(c)
+        for name in ("zero_byte_files", "gzip_integrity", "nifti_integrity"):
+            result.add(_skipped_check(name))
+        return result
+
+    # Every tree-wide check below reads this one walk instead of re-listing the tree
+    scan = _scan_tree(bids_root)
+
+    # Check 1: Zero-byte files and gzip framing (fast corruption detection)
+    zero_files = _zero_byte_files(scan)
+    zero_count = len(zero_files)
     result.add(
         ValidationCheck(
             name="zero_byte_files",
@@ -186,54 +332,29 @@ def validate_isles24_download(
             details=f"First 5: {', '.join(zero_files[:5])}" if zero_count > 0 else "",
         )
     )
-
-    # Check 2: Required files
-    config = ISLES24_VALIDATION_CONFIG
-    missing_req = [f for f in config.required_files if not (bids_root / f).exists()]
+    bad_files = _malformed_gzip_files(scan)
+    bad_count = len(bad_files)
     result.add(
         ValidationCheck(
-            name="required_files",
-            expected="all present",
-            actual=f"missing: {len(missing_req)}" if missing_req else "all present",
-            passed=len(missing_req) == 0,
-            details=f"Missing: {', '.join(missing_req)}" if missing_req else "",
+            name="gzip_integrity",
+            expected="0 malformed",
+            actual=str(bad_count),
+            passed=bad_count == 0,
+            details=f"First 5: {', '.join(bad_files[:5])}" if bad_count > 0 else "",
         )
     )
 
-    # Check 3: Required directories (ISLES24-specific)
-    for dirname in ["raw_data", "derivatives", "phenotype"]:
-        dir_path = bids_root / dirname
-        result.add(
-            ValidationCheck(
-                name=f"dir_{dirname}",
-                expected="exists",
-                actual="exists" if dir_path.exists() else "MISSING",
-                passed=dir_path.exists(),
-            )
-        )
-
-    # Check 4: Subject count (in raw_data/)
-    raw_data = bids_root / "raw_data"
-    if raw_data.exists():
-        subjects = list(raw_data.glob("sub-*"))
-        result.add(
-            check_count(
-                "subjects",
-                len(subjects),
-                ISLES24_EXPECTED_COUNTS["subjects"],
-                tolerance,
-            )
-        )
+    # Check 2: Required files, 3: Required directories, 4: Subject count (in raw_data/)
+    for c in cheap:
+        result.add(c)
 
     # Check 5: Modality counts (using ISLES24-specific patterns)
-    for modality, pattern in ISLES24_MODALITY_PATTERNS.items():
-        expected = ISLES24_EXPECTED_COUNTS.get(modality, 0)
-        if expected > 0:
-            actual = _count_isles24_modality(bids_root, pattern)
-            result.add(check_count(f"{modality}_count", actual, expected, tolerance))
+    modality_counts = _count_isles24_modalities(bids_root, _ISLES24_COUNTED_PATTERNS, scan)
+    for modality, expected in _ISLES24_COUNT_CHECKS:
+        result.add(check_count(f"{modality}_count", modality_counts[modality], expected, tolerance))
 
     # Check 6: NIfTI integrity spot-check
-    result.add(_check_nifti_integrity(bids_root, sample_size=nifti_sample_size))
+    result.add(_check_nifti_integrity(bids_root, sample_size=nifti_sample_size, scan=scan))
 
     # Check 7: Phenotype XLSX readability
     result.add(check_phenotype_readable(bids_root))
@@ -241,14 +362,19 @@ def validate_isles24_download(
     return result
 
 
-def verify_isles24_archive(archive_path: Path) -> ValidationCheck:
+def verify_isles24_archive(
+    archive_path: Path, use_cache: bool = False, parallel: bool = False
+) -> ValidationCheck:
     """
     Verify MD5 checksum of ISLES24 train.7z archive.
 
     Args:
         archive_path: Path to the train.7z archive
+        use_cache: If True, reuse a previously computed hash while the archive's
+            size and mtime are unchanged (see verify_md5).
+        parallel: If True, read ahead while hashing (see verify_md5).
 
     Returns:
         ValidationCheck with pass/fail and computed hash
     """
-    return verify_md5(archive_path, ISLES24_ARCHIVE_MD5)
+    return verify_md5(archive_path, ISLES24_ARCHIVE_MD5, use_cache=use_cache, parallel=parallel)
@@ -0,0 +1,22 @@
+"""Shared helpers for the bids_hub test suite."""
+
+import functools
+import gzip
+
+import nibabel as nib
+import numpy as np
+
+
+@functools.cache
+def nifti_gz_bytes(fill: float = 1.0) -> bytes:
+    """Serialized 2x2x2 float32 `.nii.gz` filled with `fill` (identity affine).
+
+    Cached per value, so fixtures that write many copies encode it once.
+    Level 1: the fixtures only need a valid .nii.gz, not a small one.
+    """
+    data = np.full((2, 2, 2), fill, dtype=np.float32)
+    return gzip.compress(nib.Nifti1Image(data, np.eye(4)).to_bytes(), compresslevel=1)
+
+
+# The all-ones image most fixtures write for every synthetic NIfTI
+MINIMAL_NII_GZ_BYTES = nifti_gz_bytes()
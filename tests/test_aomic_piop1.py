@@ -5,14 +5,14 @@ These tests use synthetic BIDS structures to verify the AOMIC-PIOP1 file-table b
 and HF Dataset conversion work correctly.
 """
 
-import tempfile
-from collections.abc import Generator
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import nibabel as nib
-import numpy as np
 import pandas as pd
 import pytest
+from datasets import Features, Nifti, Sequence
 
 from bids_hub import (
     build_and_push_aomic_piop1,
@@ -20,20 +20,47 @@ from bids_hub import (
     get_aomic_piop1_features,
 )
 from bids_hub.core import DatasetBuilderConfig
+from tests.conftest import MINIMAL_NII_GZ_BYTES
+
+# Under xdist (`-n auto --dist loadgroup`, see pyproject.toml), run this module on one worker so the
+# session-scoped synthetic tree is built once rather than once per worker.
+pytestmark = [
+    pytest.mark.xdist_group("aomic_piop1"),
+    # The NIfTI fixtures call nibabel heavily; keep its deprecation noise out of the report
+    pytest.mark.filterwarnings("ignore::DeprecationWarning:nibabel.*"),
+]
+
+# participants.tsv for the synthetic tree (sub-0003 has no imaging data)
+_PARTICIPANTS_TSV = (
+    b"participant_id\tage\tsex\thandedness\n"
+    b"sub-0001\t25.0\tF\tright\n"
+    b"sub-0002\t30.0\tM\tright\n"
+    b"sub-0003\t28.0\tF\tleft\n"
+)
+
 
+def _create_minimal_nifti(path: Path, template: Path | None = None) -> None:
+    """Create a minimal valid NIfTI file at the given path (parent dir must exist).
 
-def _create_minimal_nifti(path: Path) -> None:
-    """Create a minimal valid NIfTI file at the given path."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    data = np.ones((2, 2, 2), dtype=np.float32)
-    img = nib.Nifti1Image(data, np.eye(4))
-    nib.save(img, path)
+    If `template` (a file holding `MINIMAL_NII_GZ_BYTES`) is given, hardlink it
+    instead of writing the bytes again; falls back to a copy across filesystems.
+    """
+    if template is None:
+        path.write_bytes(MINIMAL_NII_GZ_BYTES)
+        return
+    try:
+        os.link(template, path)
+    except OSError:
+        shutil.copyfile(template, path)
 
 
-@pytest.fixture
-def synthetic_aomic_piop1_bids_root() -> Generator[Path, None, None]:
+@pytest.fixture(scope="session")
+def synthetic_aomic_piop1_bids_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a synthetic BIDS dataset for AOMIC-PIOP1 testing.
 
+    Session-scoped and shared by every test: treat it as READ-ONLY. A test that
+    needs to mutate the tree should `shutil.copytree` it into its own `tmp_path`.
+
     Structure (no sessions, cross-sectional):
         ds002785/
         ├── participants.tsv
@@ -50,53 +77,58 @@ def synthetic_aomic_piop1_bids_root() -> Generator[Path, None, None]:
         │       └── sub-0002_T1w.nii.gz  (minimal - only T1w)
         └── sub-0003: no imaging data (only in participants.tsv)
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir) / "ds002785"
-        root.mkdir()
-
-        # Create participants.tsv
-        participants = pd.DataFrame(
-            {
-                "participant_id": ["sub-0001", "sub-0002", "sub-0003"],
-                "age": [25.0, 30.0, 28.0],
-                "sex": ["F", "M", "F"],
-                "handedness": ["right", "right", "left"],
-            }
-        )
-        participants.to_csv(root / "participants.tsv", sep="\t", index=False)
-
+    base = tmp_path_factory.mktemp("aomic_piop1")
+    root = base / "ds002785"
+    root.mkdir()
+    # Tests only stat/glob/decode these files, so all NIfTIs can share one inode
+    template = base / "template.nii.gz"
+    _create_minimal_nifti(template)
+
+    # Create participants.tsv
+    (root / "participants.tsv").write_bytes(_PARTICIPANTS_TSV)
+
+    sub1_func = root / "sub-0001" / "func"
+    nifti_paths = [
         # sub-0001: FULL modalities (anat + dwi + func) with MULTIPLE RUNS
-        _create_minimal_nifti(root / "sub-0001" / "anat" / "sub-0001_T1w.nii.gz")
+        root / "sub-0001" / "anat" / "sub-0001_T1w.nii.gz",
         # Single DWI file (AOMIC-PIOP1 pattern)
-        _create_minimal_nifti(root / "sub-0001" / "dwi" / "sub-0001_dwi.nii.gz")
+        root / "sub-0001" / "dwi" / "sub-0001_dwi.nii.gz",
         # Multiple BOLD tasks (realistic AOMIC-PIOP1 naming with acq-* entities)
-        sub1_func = root / "sub-0001" / "func"
-        _create_minimal_nifti(sub1_func / "sub-0001_task-restingstate_acq-mb3_bold.nii.gz")
-        _create_minimal_nifti(sub1_func / "sub-0001_task-emomatching_acq-seq_bold.nii.gz")
-
+        sub1_func / "sub-0001_task-restingstate_acq-mb3_bold.nii.gz",
+        sub1_func / "sub-0001_task-emomatching_acq-seq_bold.nii.gz",
         # sub-0002: has T1w only (minimal)
-        _create_minimal_nifti(root / "sub-0002" / "anat" / "sub-0002_T1w.nii.gz")
-
+        root / "sub-0002" / "anat" / "sub-0002_T1w.nii.gz",
         # sub-0003: no imaging data at all (only in participants.tsv)
+    ]
+    # Create each leaf directory once, then only link files
+    for directory in {path.parent for path in nifti_paths}:
+        directory.mkdir(parents=True, exist_ok=True)
+    # link syscalls are independent; overlap them (helps on slow/network FS)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda path: _create_minimal_nifti(path, template), nifti_paths))
+
+    return root
 
-        yield root
+
+@pytest.fixture(scope="session")
+def aomic_piop1_file_table(synthetic_aomic_piop1_bids_root: Path) -> pd.DataFrame:
+    """File table built once from the shared synthetic tree (READ-ONLY)."""
+    return build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
 
 
 class TestBuildAomicPiop1FileTable:
     """Tests for build_aomic_piop1_file_table function."""
 
-    def test_build_file_table_returns_dataframe(
-        self, synthetic_aomic_piop1_bids_root: Path
-    ) -> None:
+    def test_build_file_table_returns_dataframe(self, aomic_piop1_file_table: pd.DataFrame) -> None:
         """Test that build_aomic_piop1_file_table returns a DataFrame."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         assert isinstance(df, pd.DataFrame)
 
     def test_build_file_table_has_correct_columns(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that the DataFrame has all expected columns."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         expected_columns = {
             "subject_id",
             "t1w",
@@ -109,18 +141,18 @@ class TestBuildAomicPiop1FileTable:
         assert set(df.columns) == expected_columns
 
     def test_build_file_table_has_correct_row_count(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that DataFrame has one row per SUBJECT with imaging data."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         # sub-0001 has data, sub-0002 has data, sub-0003 has NO data
         assert len(df) == 2  # 2 subjects with imaging data
 
     def test_build_file_table_subject_with_all_modalities(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that subject with all modalities has all paths populated."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         # sub-0001 has ALL modalities: T1w, dwi (2 runs), bold (2 tasks)
         sub1 = df[df["subject_id"] == "sub-0001"].iloc[0]
 
@@ -142,10 +174,10 @@ class TestBuildAomicPiop1FileTable:
         assert sub1["handedness"] == "right"
 
     def test_build_file_table_subject_partial_modalities(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that subject with partial modalities has empty lists for missing."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         # sub-0002 has only T1w (no dwi, no bold)
         sub2 = df[df["subject_id"] == "sub-0002"].iloc[0]
 
@@ -154,9 +186,9 @@ class TestBuildAomicPiop1FileTable:
         assert sub2["dwi"] == []  # No dwi/ directory
         assert sub2["bold"] == []  # No func/ directory
 
-    def test_build_file_table_dwi_as_list(self, synthetic_aomic_piop1_bids_root: Path) -> None:
+    def test_build_file_table_dwi_as_list(self, aomic_piop1_file_table: pd.DataFrame) -> None:
         """Test that DWI files are captured as list (even when single file)."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         sub1 = df[df["subject_id"] == "sub-0001"].iloc[0]
 
         assert isinstance(sub1["dwi"], list)
@@ -165,10 +197,10 @@ class TestBuildAomicPiop1FileTable:
         assert all(isinstance(p, str) for p in sub1["dwi"])
 
     def test_build_file_table_multiple_bold_runs(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that multiple BOLD tasks are captured as list."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         sub1 = df[df["subject_id"] == "sub-0001"].iloc[0]
 
         assert isinstance(sub1["bold"], list)
@@ -177,28 +209,26 @@ class TestBuildAomicPiop1FileTable:
         assert all(isinstance(p, str) for p in sub1["bold"])
 
     def test_build_file_table_missing_subject_excluded(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that subjects with no imaging data are excluded."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         # sub-0003 has no imaging data, should not appear
         sub3_rows = df[df["subject_id"] == "sub-0003"]
         assert len(sub3_rows) == 0
 
-    def test_build_file_table_paths_are_strings(
-        self, synthetic_aomic_piop1_bids_root: Path
-    ) -> None:
+    def test_build_file_table_paths_are_strings(self, aomic_piop1_file_table: pd.DataFrame) -> None:
         """Test that t1w column contains strings (not Path objects)."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         sub1 = df[df["subject_id"] == "sub-0001"].iloc[0]
 
         assert isinstance(sub1["t1w"], str)
 
     def test_build_file_table_metadata_extracted(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that metadata is correctly extracted from participants.tsv."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         sub1 = df[df["subject_id"] == "sub-0001"].iloc[0]
         sub2 = df[df["subject_id"] == "sub-0002"].iloc[0]
 
@@ -223,10 +253,10 @@ class TestBuildAomicPiop1FileTable:
             build_aomic_piop1_file_table(Path("/nonexistent/path"))
 
     def test_build_file_table_empty_lists_for_missing_sequences(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that missing sequences result in empty lists (not None)."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         sub2 = df[df["subject_id"] == "sub-0002"].iloc[0]
 
         assert sub2["dwi"] == []  # Empty list, not None
@@ -235,10 +265,10 @@ class TestBuildAomicPiop1FileTable:
         assert isinstance(sub2["bold"], list)
 
     def test_build_file_table_paths_are_absolute(
-        self, synthetic_aomic_piop1_bids_root: Path
+        self, aomic_piop1_file_table: pd.DataFrame
     ) -> None:
         """Test that file paths are absolute."""
-        df = build_aomic_piop1_file_table(synthetic_aomic_piop1_bids_root)
+        df = aomic_piop1_file_table
         sub1 = df[df["subject_id"] == "sub-0001"].iloc[0]
 
         # Wrap strings in Path() to check absolute
@@ -252,15 +282,11 @@ class TestGetAomicPiop1Features:
 
     def test_get_features_returns_features(self) -> None:
         """Test that get_aomic_piop1_features returns a Features object."""
-        from datasets import Features
-
         features = get_aomic_piop1_features()
         assert isinstance(features, Features)
 
     def test_get_features_has_nifti_columns(self) -> None:
         """Test that Nifti columns are present with correct types."""
-        from datasets import Nifti, Sequence
-
         features = get_aomic_piop1_features()
 
         # Structural: single file per subject
@@ -280,37 +306,52 @@ class TestGetAomicPiop1Features:
 
 
 class TestBuildAndPushAomicPiop1:
-    """Tests for build_and_push_aomic_piop1 integration."""
+    """Tests for build_and_push_aomic_piop1 integration.
+
+    The file-table build is patched out, so these tests never touch a BIDS tree.
+    """
 
-    def test_dry_run_calls_build_hf_dataset(self, synthetic_aomic_piop1_bids_root: Path) -> None:
+    def test_dry_run_calls_build_hf_dataset(self, tmp_path: Path) -> None:
         """Test that dry run calls build_hf_dataset with correct arguments."""
-        from unittest.mock import patch
+        from unittest.mock import ANY, DEFAULT, patch
 
         config = DatasetBuilderConfig(
-            bids_root=synthetic_aomic_piop1_bids_root,
+            bids_root=tmp_path,
             hf_repo_id="test/test-repo",
             dry_run=True,
         )
-
-        with patch("bids_hub.datasets.aomic_piop1.build_hf_dataset") as mock_build:
-            mock_build.return_value = None
+        file_table = pd.DataFrame({"subject_id": ["sub-0001"]})
+
+        with patch.multiple(
+            "bids_hub.datasets.aomic_piop1",
+            build_aomic_piop1_file_table=DEFAULT,
+            build_hf_dataset=DEFAULT,
+        ) as mocks:
+            mocks["build_aomic_piop1_file_table"].return_value = file_table
+            mocks["build_hf_dataset"].return_value = None
             build_and_push_aomic_piop1(config)
-            mock_build.assert_called_once()
+            mocks["build_aomic_piop1_file_table"].assert_called_once_with(tmp_path)
+            mocks["build_hf_dataset"].assert_called_once_with(config, file_table, ANY)
 
-    def test_dry_run_does_not_push(self, synthetic_aomic_piop1_bids_root: Path) -> None:
+    def test_dry_run_does_not_push(self, tmp_path: Path) -> None:
         """Test that dry run does not call push_dataset_to_hub."""
-        from unittest.mock import MagicMock, patch
+        from unittest.mock import DEFAULT, MagicMock, patch
 
         config = DatasetBuilderConfig(
-            bids_root=synthetic_aomic_piop1_bids_root,
+            bids_root=tmp_path,
             hf_repo_id="test/test-repo",
             dry_run=True,
         )
 
-        with (
-            patch("bids_hub.datasets.aomic_piop1.build_hf_dataset") as mock_build,
-            patch("bids_hub.datasets.aomic_piop1.push_dataset_to_hub") as mock_push,
-        ):
-            mock_build.return_value = MagicMock()
+        with patch.multiple(
+            "bids_hub.datasets.aomic_piop1",
+            build_aomic_piop1_file_table=DEFAULT,
+            build_hf_dataset=DEFAULT,
+            push_dataset_to_hub=DEFAULT,
+        ) as mocks:
+            mocks["build_aomic_piop1_file_table"].return_value = pd.DataFrame(
+                {"subject_id": ["sub-0001"]}
+            )
+            mocks["build_hf_dataset"].return_value = MagicMock()
             build_and_push_aomic_piop1(config)
-            mock_push.assert_not_called()
+            mocks["push_dataset_to_hub"].assert_not_called()
@@ -5,14 +5,14 @@ These tests use synthetic BIDS structures to verify the ARC file-table builder
 and HF Dataset conversion work correctly.
 """
 
-import tempfile
-from collections.abc import Generator
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import nibabel as nib
-import numpy as np
 import pandas as pd
 import pytest
+from datasets import Features, Nifti, Sequence, Value
 
 from bids_hub import (
     build_and_push_arc,
@@ -21,20 +21,52 @@ from bids_hub import (
 )
 from bids_hub.core import DatasetBuilderConfig
 from bids_hub.datasets.arc import _extract_acquisition_type
+from tests.conftest import MINIMAL_NII_GZ_BYTES
+
+# Keep this module on one xdist worker so the session-scoped tree is built once;
+# mutating tests work on a per-test copy (mutable_bids_root) and need no isolation.
+pytestmark = [
+    pytest.mark.xdist_group("arc"),
+    # The NIfTI fixtures call nibabel heavily; keep its deprecation noise out of the report
+    pytest.mark.filterwarnings("ignore::DeprecationWarning:nibabel.*"),
+]
+
+# Static participants.tsv; sub-M2001 has missing race, sub-M2003 has missing wab_aq
+_PARTICIPANTS_TSV = (
+    b"participant_id\tsex\tage_at_stroke\trace\twab_days\twab_aq\twab_type\n"
+    b"sub-M2001\tF\t38.0\t\t895\t87.1\tAnomic\n"
+    b"sub-M2002\tM\t55.0\tw\t3682\t72.6\tBroca\n"
+    b"sub-M2003\tF\t42.0\tb\t1500\t\tn/a\n"
+)
+
+# sub-M2001 ses-1 DWI runs: run -> (bval, bvec); each run has a different direction count
+_DWI_GRADIENTS = {
+    "01": (b"0 1000 2000", b"1 0 0\n0 1 0\n0 0 1"),
+    "02": (b"0 1000", b"1 0\n0 1\n0 0"),
+    "03": (b"0 500 1000 1500", b"1 0 0 0\n0 1 0 0\n0 0 1 0"),
+}
 
 
 def _create_minimal_nifti(path: Path) -> None:
-    """Create a minimal valid NIfTI file at the given path."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    data = np.ones((2, 2, 2), dtype=np.float32)
-    img = nib.Nifti1Image(data, np.eye(4))
-    nib.save(img, path)
+    """Create a minimal valid NIfTI file at the given path (parent must exist)."""
+    path.write_bytes(MINIMAL_NII_GZ_BYTES)
 
 
-@pytest.fixture
-def synthetic_bids_root() -> Generator[Path, None, None]:
+def _link_or_copy(src: str, dst: str) -> None:
+    """`shutil.copytree` copy function: hardlink, falling back to a copy across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@pytest.fixture(scope="session")
+def synthetic_bids_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a synthetic BIDS dataset for testing.
 
+    Session-scoped and shared by every test: treat it as READ-ONLY. Tests that
+    add files must use `mutable_bids_root` instead.
+
     Structure (multi-session, ALL modalities):
         ds004884/
         ├── participants.tsv
@@ -65,120 +97,89 @@ def synthetic_bids_root() -> Generator[Path, None, None]:
                 └── sub-M2002/
                     └── ses-1/...
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir) / "ds004884"
-        root.mkdir()
-
-        # Create participants.tsv
-        participants = pd.DataFrame(
-            {
-                "participant_id": ["sub-M2001", "sub-M2002", "sub-M2003"],
-                "sex": ["F", "M", "F"],
-                "age_at_stroke": [38.0, 55.0, 42.0],
-                "race": [None, "w", "b"],  # sub-M2001 has missing race
-                "wab_days": [895, 3682, 1500],
-                "wab_aq": [87.1, 72.6, None],  # sub-M2003 has missing wab_aq
-                "wab_type": ["Anomic", "Broca", "n/a"],
-            }
-        )
-        participants.to_csv(root / "participants.tsv", sep="\t", index=False)
+    root = tmp_path_factory.mktemp("arc") / "ds004884"
+    root.mkdir()
 
+    nii = MINIMAL_NII_GZ_BYTES
+    masks = "derivatives/lesion_masks"
+    files: list[tuple[str, bytes]] = [
+        ("participants.tsv", _PARTICIPANTS_TSV),
         # sub-M2001 ses-1: FULL modalities (anat + func + dwi) with MULTIPLE RUNS
-        _create_minimal_nifti(root / "sub-M2001" / "ses-1" / "anat" / "sub-M2001_ses-1_T1w.nii.gz")
-        _create_minimal_nifti(
-            root / "sub-M2001" / "ses-1" / "anat" / "sub-M2001_ses-1_acq-spc3p2_T2w.nii.gz"
-        )
-        _create_minimal_nifti(
-            root / "sub-M2001" / "ses-1" / "anat" / "sub-M2001_ses-1_FLAIR.nii.gz"
-        )
+        ("sub-M2001/ses-1/anat/sub-M2001_ses-1_T1w.nii.gz", nii),
+        ("sub-M2001/ses-1/anat/sub-M2001_ses-1_acq-spc3p2_T2w.nii.gz", nii),
+        ("sub-M2001/ses-1/anat/sub-M2001_ses-1_FLAIR.nii.gz", nii),
         # Multiple BOLD runs (testing multi-run support)
         # Task split testing: 2 rest, 1 naming40
-        _create_minimal_nifti(
-            root / "sub-M2001" / "ses-1" / "func" / "sub-M2001_ses-1_task-rest_run-01_bold.nii.gz"
-        )
-        _create_minimal_nifti(
-            root / "sub-M2001" / "ses-1" / "func" / "sub-M2001_ses-1_task-rest_run-02_bold.nii.gz"
-        )
-        _create_minimal_nifti(
-            root
-            / "sub-M2001"
-            / "ses-1"
-            / "func"
-            / "sub-M2001_ses-1_task-naming40_run-01_bold.nii.gz"
-        )
-
+        ("sub-M2001/ses-1/func/sub-M2001_ses-1_task-rest_run-01_bold.nii.gz", nii),
+        ("sub-M2001/ses-1/func/sub-M2001_ses-1_task-rest_run-02_bold.nii.gz", nii),
+        ("sub-M2001/ses-1/func/sub-M2001_ses-1_task-naming40_run-01_bold.nii.gz", nii),
         # Multiple DWI runs WITH GRADIENTS
-        dwi_dir = root / "sub-M2001" / "ses-1" / "dwi"
-        _create_minimal_nifti(dwi_dir / "sub-M2001_ses-1_run-01_dwi.nii.gz")
-        (dwi_dir / "sub-M2001_ses-1_run-01_dwi.bval").write_text("0 1000 2000")
-        (dwi_dir / "sub-M2001_ses-1_run-01_dwi.bvec").write_text("1 0 0\n0 1 0\n0 0 1")
+        *(
+            (f"sub-M2001/ses-1/dwi/sub-M2001_ses-1_run-{run}_dwi{suffix}", blob)
+            for run, (bval, bvec) in _DWI_GRADIENTS.items()
+            for suffix, blob in ((".nii.gz", nii), (".bval", bval), (".bvec", bvec))
+        ),
+        # Single sbref
+        ("sub-M2001/ses-1/dwi/sub-M2001_ses-1_sbref.nii.gz", nii),
+        # sub-M2001 ses-2: has T1w and T2w only (no FLAIR, no func, no dwi)
+        ("sub-M2001/ses-2/anat/sub-M2001_ses-2_T1w.nii.gz", nii),
+        ("sub-M2001/ses-2/anat/sub-M2001_ses-2_acq-tse3_T2w.nii.gz", nii),
+        # sub-M2002 ses-1: has T1w only (minimal)
+        ("sub-M2002/ses-1/anat/sub-M2002_ses-1_T1w.nii.gz", nii),
+        # sub-M2003: no imaging data at all (only in participants.tsv)
+        # derivatives/lesion_masks (sub-M2003: no lesion mask)
+        (f"{masks}/sub-M2001/ses-1/anat/sub-M2001_ses-1_desc-lesion_mask.nii.gz", nii),
+        (f"{masks}/sub-M2001/ses-2/anat/sub-M2001_ses-2_desc-lesion_mask.nii.gz", nii),
+        (f"{masks}/sub-M2002/ses-1/anat/sub-M2002_ses-1_desc-lesion_mask.nii.gz", nii),
+    ]
 
-        _create_minimal_nifti(dwi_dir / "sub-M2001_ses-1_run-02_dwi.nii.gz")
-        (dwi_dir / "sub-M2001_ses-1_run-02_dwi.bval").write_text("0 1000")
-        (dwi_dir / "sub-M2001_ses-1_run-02_dwi.bvec").write_text("1 0\n0 1\n0 0")
+    # Create every directory once, shallowest first, then write files without
+    # re-checking their ancestors. Each path is unique, so writes can overlap.
+    paths = [(root / rel, blob) for rel, blob in files]
+    dirs = {ancestor for path, _ in paths for ancestor in path.parents if root in ancestor.parents}
+    for directory in sorted(dirs, key=lambda d: len(d.parts)):
+        directory.mkdir()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda item: item[0].write_bytes(item[1]), paths))
 
-        _create_minimal_nifti(dwi_dir / "sub-M2001_ses-1_run-03_dwi.nii.gz")
-        (dwi_dir / "sub-M2001_ses-1_run-03_dwi.bval").write_text("0 500 1000 1500")
-        (dwi_dir / "sub-M2001_ses-1_run-03_dwi.bvec").write_text("1 0 0 0\n0 1 0 0\n0 0 1 0")
+    return root
 
-        # Single sbref
-        _create_minimal_nifti(root / "sub-M2001" / "ses-1" / "dwi" / "sub-M2001_ses-1_sbref.nii.gz")
 
-        # sub-M2001 ses-2: has T1w and T2w only (no FLAIR, no func, no dwi)
-        _create_minimal_nifti(root / "sub-M2001" / "ses-2" / "anat" / "sub-M2001_ses-2_T1w.nii.gz")
-        _create_minimal_nifti(
-            root / "sub-M2001" / "ses-2" / "anat" / "sub-M2001_ses-2_acq-tse3_T2w.nii.gz"
-        )
+@pytest.fixture(scope="session")
+def arc_file_table(synthetic_bids_root: Path) -> pd.DataFrame:
+    """File table built once from the shared synthetic tree (READ-ONLY)."""
+    return build_arc_file_table(synthetic_bids_root)
 
-        # sub-M2002 ses-1: has T1w only (minimal)
-        _create_minimal_nifti(root / "sub-M2002" / "ses-1" / "anat" / "sub-M2002_ses-1_T1w.nii.gz")
 
-        # sub-M2003: no imaging data at all (only in participants.tsv)
+@pytest.fixture(scope="session")
+def arc_rows(arc_file_table: pd.DataFrame) -> dict[tuple[str, str], pd.Series]:
+    """Rows of `arc_file_table` keyed by (subject_id, session_id) (READ-ONLY)."""
+    indexed = arc_file_table.set_index(["subject_id", "session_id"], drop=False)
+    return dict(indexed.iterrows())
 
-        # Create derivatives/lesion_masks
-        _create_minimal_nifti(
-            root
-            / "derivatives"
-            / "lesion_masks"
-            / "sub-M2001"
-            / "ses-1"
-            / "anat"
-            / "sub-M2001_ses-1_desc-lesion_mask.nii.gz"
-        )
-        _create_minimal_nifti(
-            root
-            / "derivatives"
-            / "lesion_masks"
-            / "sub-M2001"
-            / "ses-2"
-            / "anat"
-            / "sub-M2001_ses-2_desc-lesion_mask.nii.gz"
-        )
-        _create_minimal_nifti(
-            root
-            / "derivatives"
-            / "lesion_masks"
-            / "sub-M2002"
-            / "ses-1"
-            / "anat"
-            / "sub-M2002_ses-1_desc-lesion_mask.nii.gz"
-        )
-        # sub-M2003: no lesion mask
 
-        yield root
+@pytest.fixture
+def mutable_bids_root(synthetic_bids_root: Path, tmp_path: Path) -> Path:
+    """Per-test copy of `synthetic_bids_root` for tests that modify the tree.
+
+    Tests only ever add files, so existing files are hardlinked rather than copied.
+    """
+    return Path(
+        shutil.copytree(synthetic_bids_root, tmp_path / "ds004884", copy_function=_link_or_copy)
+    )
 
 
 class TestBuildArcFileTable:
     """Tests for build_arc_file_table function."""
 
-    def test_build_file_table_returns_dataframe(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_returns_dataframe(self, arc_file_table: pd.DataFrame) -> None:
         """Test that build_arc_file_table returns a DataFrame."""
-        df = build_arc_file_table(synthetic_bids_root)
+        df = arc_file_table
         assert isinstance(df, pd.DataFrame)
 
-    def test_build_file_table_has_correct_columns(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_has_correct_columns(self, arc_file_table: pd.DataFrame) -> None:
         """Test that the DataFrame has all expected columns (FULL dataset)."""
-        df = build_arc_file_table(synthetic_bids_root)
+        df = arc_file_table
         expected_columns = {
             "subject_id",
             "session_id",
@@ -202,17 +203,18 @@ class TestBuildArcFileTable:
         }
         assert set(df.columns) == expected_columns
 
-    def test_build_file_table_has_correct_row_count(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_has_correct_row_count(self, arc_file_table: pd.DataFrame) -> None:
         """Test that DataFrame has one row per SESSION (not per subject)."""
-        df = build_arc_file_table(synthetic_bids_root)
+        df = arc_file_table
         # sub-M2001 has 2 sessions, sub-M2002 has 1 session, sub-M2003 has 0 sessions
         assert len(df) == 3  # 3 sessions total (not 3 subjects)
 
-    def test_build_file_table_session_with_all_modalities(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_session_with_all_modalities(
+        self, arc_rows: dict[tuple[str, str], pd.Series]
+    ) -> None:
         """Test that session with all modalities has all paths populated."""
-        df = build_arc_file_table(synthetic_bids_root)
         # sub-M2001 ses-1 has ALL modalities: T1w, T2w, FLAIR, bold, dwi, sbref, lesion
-        ses1 = df[(df["subject_id"] == "sub-M2001") & (df["session_id"] == "ses-1")].iloc[0]
+        ses1 = arc_rows[("sub-M2001", "ses-1")]
 
         # Structural: single paths (now lists)
         assert isinstance(ses1["t1w"], list)
@@ -251,11 +253,12 @@ class TestBuildArcFileTable:
         assert ses1["wab_days"] == 895.0
         assert ses1["wab_type"] == "Anomic"
 
-    def test_build_file_table_session_partial_modalities(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_session_partial_modalities(
+        self, arc_rows: dict[tuple[str, str], pd.Series]
+    ) -> None:
         """Test that session with partial modalities has empty list for missing modalities."""
-        df = build_arc_file_table(synthetic_bids_root)
         # sub-M2001 ses-2 has only T1w and T2w (no FLAIR, no func, no dwi)
-        ses2 = df[(df["subject_id"] == "sub-M2001") & (df["session_id"] == "ses-2")].iloc[0]
+        ses2 = arc_rows[("sub-M2001", "ses-2")]
 
         assert isinstance(ses2["t1w"], list)
         assert len(ses2["t1w"]) == 1
@@ -270,11 +273,12 @@ class TestBuildArcFileTable:
         assert ses2["sbref"] == []  # No dwi/ in ses-2 (empty list)
         assert ses2["lesion"] is not None
 
-    def test_build_file_table_session_with_minimal_data(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_session_with_minimal_data(
+        self, arc_rows: dict[tuple[str, str], pd.Series]
+    ) -> None:
         """Test that session with minimal data has empty list for missing modalities."""
-        df = build_arc_file_table(synthetic_bids_root)
         # sub-M2002 ses-1 has T1w only (minimal - only structural T1w)
-        sub2_ses1 = df[(df["subject_id"] == "sub-M2002") & (df["session_id"] == "ses-1")].iloc[0]
+        sub2_ses1 = arc_rows[("sub-M2002", "ses-1")]
 
         assert isinstance(sub2_ses1["t1w"], list)
         assert len(sub2_ses1["t1w"]) == 1
@@ -292,10 +296,9 @@ class TestBuildArcFileTable:
         assert sub2_ses1["race"] == "w"
         assert sub2_ses1["wab_days"] == 3682.0
 
-    def test_bold_split_by_task(self, synthetic_bids_root: Path) -> None:
+    def test_bold_split_by_task(self, arc_rows: dict[tuple[str, str], pd.Series]) -> None:
         """Verify BOLD files are correctly split by task entity."""
-        df = build_arc_file_table(synthetic_bids_root)
-        ses1 = df[(df["subject_id"] == "sub-M2001") & (df["session_id"] == "ses-1")].iloc[0]
+        ses1 = arc_rows[("sub-M2001", "ses-1")]
 
         # Verify types
         assert isinstance(ses1["bold_naming40"], list)
@@ -309,35 +312,36 @@ class TestBuildArcFileTable:
         assert "task-naming40" in ses1["bold_naming40"][0]
         assert all("task-rest" in p for p in ses1["bold_rest"])
 
-    def test_bold_unexpected_task_raises(self, synthetic_bids_root: Path) -> None:
+    def test_bold_unexpected_task_raises(self, mutable_bids_root: Path) -> None:
         """Unexpected BOLD task types should fail fast (prevent silent data loss)."""
         # Create a BOLD file with unexpected task
-        func_dir = synthetic_bids_root / "sub-M2001" / "ses-1" / "func"
+        func_dir = mutable_bids_root / "sub-M2001" / "ses-1" / "func"
         unexpected_bold = func_dir / "sub-M2001_ses-1_task-unknown_run-01_bold.nii.gz"
         _create_minimal_nifti(unexpected_bold)
 
         with pytest.raises(ValueError, match=r"Unexpected BOLD task"):
-            build_arc_file_table(synthetic_bids_root)
+            build_arc_file_table(mutable_bids_root)
 
-    def test_build_file_table_no_sessions_excluded(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_no_sessions_excluded(self, arc_file_table: pd.DataFrame) -> None:
         """Test that subjects with no sessions are excluded from output."""
-        df = build_arc_file_table(synthetic_bids_root)
+        df = arc_file_table
         # sub-M2003 has no imaging data (no sessions), should not appear
         sub3_rows = df[df["subject_id"] == "sub-M2003"]
         assert len(sub3_rows) == 0
 
-    def test_build_file_table_multiple_sessions(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_multiple_sessions(self, arc_file_table: pd.DataFrame) -> None:
         """Test that subjects with multiple sessions have multiple rows."""
-        df = build_arc_file_table(synthetic_bids_root)
+        df = arc_file_table
         # sub-M2001 has 2 sessions
         sub1_rows = df[df["subject_id"] == "sub-M2001"]
         assert len(sub1_rows) == 2
         assert set(sub1_rows["session_id"]) == {"ses-1", "ses-2"}
 
-    def test_build_file_table_paths_are_absolute(self, synthetic_bids_root: Path) -> None:
+    def test_build_file_table_paths_are_absolute(
+        self, arc_rows: dict[tuple[str, str], pd.Series]
+    ) -> None:
         """Test that file paths are absolute."""
-        df = build_arc_file_table(synthetic_bids_root)
-        ses1 = df[(df["subject_id"] == "sub-M2001") & (df["session_id"] == "ses-1")].iloc[0]
+        ses1 = arc_rows[("sub-M2001", "ses-1")]
 
         # t1w is now a list, check first element
         assert Path(ses1["t1w"][0]).is_absolute()
@@ -408,15 +412,11 @@ class TestGetArcFeatures:
 
     def test_get_features_returns_features(self) -> None:
         """Test that get_arc_features returns a Features object."""
-        from datasets import Features
-
         features = get_arc_features()
         assert isinstance(features, Features)
 
     def test_get_features_has_nifti_columns(self) -> None:
         """Test that ALL Nifti columns are present (FULL dataset)."""
-        from datasets import Nifti, Sequence
-
         features = get_arc_features()
 
         # Structural: multiple runs per session (Sequence of Nifti)
@@ -433,8 +433,6 @@ class TestGetArcFeatures:
 
     def test_get_features_has_gradient_columns(self) -> None:
         """Test that dwi_bvals/dwi_bvecs are present as list[str]."""
-        from datasets import Sequence, Value
-
         features = get_arc_features()
 
         assert isinstance(features["dwi_bvals"], Sequence)
@@ -544,42 +542,40 @@ class TestExtractAcquisitionType:
 class TestBuildArcFileTableAcquisition:
     """Tests for t2w_acquisition column in file table."""
 
-    def test_acquisition_column_exists(self, synthetic_bids_root: Path) -> None:
+    def test_acquisition_column_exists(self, arc_file_table: pd.DataFrame) -> None:
         """Verify t2w_acquisition column is present."""
-        df = build_arc_file_table(synthetic_bids_root)
+        df = arc_file_table
         assert "t2w_acquisition" in df.columns
 
-    def test_acquisition_populated_correctly(self, synthetic_bids_root: Path) -> None:
+    def test_acquisition_populated_correctly(
+        self, arc_rows: dict[tuple[str, str], pd.Series]
+    ) -> None:
         """Verify acquisition values are correctly populated."""
-        df = build_arc_file_table(synthetic_bids_root)
-
         # sub-M2001 ses-1 should have space_2x (acq-spc3p2)
-        ses1 = df[(df["subject_id"] == "sub-M2001") & (df["session_id"] == "ses-1")].iloc[0]
+        ses1 = arc_rows[("sub-M2001", "ses-1")]
         assert ses1["t2w_acquisition"] == "space_2x"
 
         # sub-M2001 ses-2 should have turbo_spin_echo (acq-tse3)
-        ses2 = df[(df["subject_id"] == "sub-M2001") & (df["session_id"] == "ses-2")].iloc[0]
+        ses2 = arc_rows[("sub-M2001", "ses-2")]
         assert ses2["t2w_acquisition"] == "turbo_spin_echo"
 
-    def test_acquisition_none_when_no_t2w(self, synthetic_bids_root: Path) -> None:
+    def test_acquisition_none_when_no_t2w(self, arc_rows: dict[tuple[str, str], pd.Series]) -> None:
         """Verify acquisition is None when T2w is missing."""
-        df = build_arc_file_table(synthetic_bids_root)
-
         # sub-M2002 ses-1 has no T2w
-        sub2 = df[(df["subject_id"] == "sub-M2002") & (df["session_id"] == "ses-1")].iloc[0]
+        sub2 = arc_rows[("sub-M2002", "ses-1")]
         assert sub2["t2w_acquisition"] is None
 
-    def test_multi_t2w_session_includes_all_files(self, synthetic_bids_root: Path) -> None:
+    def test_multi_t2w_session_includes_all_files(self, mutable_bids_root: Path) -> None:
         """Verify sessions with multiple T2w files include all files.
 
         When a session contains multiple T2w files, we should collect all of them
         and use the first one to determine the acquisition type.
         """
         # Add a second T2w to an existing session
-        anat_dir = synthetic_bids_root / "sub-M2001" / "ses-1" / "anat"
+        anat_dir = mutable_bids_root / "sub-M2001" / "ses-1" / "anat"
         _create_minimal_nifti(anat_dir / "sub-M2001_ses-1_acq-spc3_T2w.nii.gz")
 
-        df = build_arc_file_table(synthetic_bids_root)
+        df = build_arc_file_table(mutable_bids_root)
         ses1 = df[(df["subject_id"] == "sub-M2001") & (df["session_id"] == "ses-1")].iloc[0]
 
         # Should have 2 T2w files (original spc3p2 + new spc3)
@@ -600,8 +596,6 @@ class TestGetArcFeaturesAcquisition:
 
     def test_acquisition_in_schema(self) -> None:
         """Verify t2w_acquisition is in the Features schema."""
-        from datasets import Value
-
         features = get_arc_features()
 
         assert "t2w_acquisition" in features
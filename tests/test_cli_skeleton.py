@@ -8,7 +8,8 @@ without actually running the full dataset processing pipelines.
 import re
 from pathlib import Path
 
-from typer.testing import CliRunner
+import pytest
+from typer.testing import CliRunner, Result
 
 from bids_hub.cli import app
 
@@ -20,21 +21,28 @@ def strip_ansi(text: str) -> str:
     return re.sub(r"\x1b\[[0-9;]*m", "", text)
 
 
+@pytest.fixture(scope="module")
+def help_results() -> dict[tuple[str, ...], Result]:
+    """Rendered `--help` results keyed by command path, invoked once per module."""
+    commands = [(), ("arc", "build"), ("arc", "info")]
+    return {command: runner.invoke(app, [*command, "--help"]) for command in commands}
+
+
 class TestCliHelp:
     """Tests for CLI help output."""
 
-    def test_main_help(self) -> None:
+    def test_main_help(self, help_results: dict[tuple[str, ...], Result]) -> None:
         """Test that main --help works."""
-        result = runner.invoke(app, ["--help"])
+        result = help_results[()]
 
         assert result.exit_code == 0
         assert "arc" in result.stdout.lower()
         assert "isles24" in result.stdout.lower()
         assert "list" in result.stdout.lower()
 
-    def test_build_help(self) -> None:
+    def test_build_help(self, help_results: dict[tuple[str, ...], Result]) -> None:
         """Test that arc build --help works."""
-        result = runner.invoke(app, ["arc", "build", "--help"])
+        result = help_results[("arc", "build")]
         stdout = strip_ansi(result.stdout)
 
         assert result.exit_code == 0
@@ -42,11 +50,12 @@ class TestCliHelp:
         assert "--hf-repo" in stdout
         assert "--dry-run" in stdout
 
-    def test_info_help(self) -> None:
+    def test_info_help(self, help_results: dict[tuple[str, ...], Result]) -> None:
         """Test that arc info --help works."""
-        result = runner.invoke(app, ["arc", "info", "--help"])
+        result = help_results[("arc", "info")]
 
         assert result.exit_code == 0
+        assert "ARC" in strip_ansi(result.stdout)
 
 
 class TestCliCommands:
@@ -116,3 +125,28 @@ class TestCliOutput:
 
         # Should show processing message even if it fails later
         assert "Processing ARC" in result.stdout or "ARC" in result.stdout
+
+    def test_isles24_validate_reports_archive_md5(self, tmp_path: Path) -> None:
+        """Test that --archive adds the archive MD5 check to the validation report."""
+        archive = tmp_path / "train.7z"
+        archive.write_bytes(b"not the real archive")
+
+        result = runner.invoke(
+            app, ["isles24", "validate", str(tmp_path), "--archive", str(archive)]
+        )
+
+        assert result.exit_code == 1
+        assert "md5_train.7z" in result.stdout
+
+
+def test_cli_import_defers_datasets() -> None:
+    """Importing the CLI (e.g. for `validate`) must not pull in `datasets`/pandas."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, bids_hub, bids_hub.cli; "
+        "assert 'datasets' not in sys.modules and 'pandas' not in sys.modules; "
+        "assert bids_hub.build_hf_dataset is bids_hub.core.build_hf_dataset"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
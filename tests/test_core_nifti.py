@@ -8,10 +8,14 @@ without requiring real NIfTI files or BIDS datasets.
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import DEFAULT, patch
 
 import nibabel as nib
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from datasets import Dataset, Features, Nifti, Value
 
@@ -21,6 +25,14 @@ from bids_hub.core import (
     push_dataset_to_hub,
     validate_file_table_columns,
 )
+from tests.conftest import nifti_gz_bytes
+
+# Keep this module on one xdist worker so the session-scoped fixture is built once
+pytestmark = [
+    pytest.mark.xdist_group("core_nifti"),
+    # The NIfTI fixtures call nibabel heavily; keep its deprecation noise out of the report
+    pytest.mark.filterwarnings("ignore::DeprecationWarning:nibabel.*"),
+]
 
 
 @pytest.fixture
@@ -45,48 +57,48 @@ def simple_features() -> Features:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temp_nifti_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory with fake NIfTI files."""
+    """Create a temporary directory with fake NIfTI files (session-wide, READ-ONLY)."""
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
 
-        # Create minimal NIfTI files using nibabel
+        # Create minimal 2x2x2 NIfTI files; sub-i is all i+1 so rows can be told apart
         for i in range(3):
-            # Create a tiny 2x2x2 image (minimal valid NIfTI)
-            data = np.ones((2, 2, 2), dtype=np.float32) * (i + 1)
-            img = nib.Nifti1Image(data, np.eye(4))
-            nib.save(img, tmppath / f"sub-{i:03d}_T1w.nii.gz")
+            (tmppath / f"sub-{i:03d}_T1w.nii.gz").write_bytes(nifti_gz_bytes(i + 1))
 
         yield tmppath
 
 
+@pytest.fixture(scope="session")
+def nifti_file_table(temp_nifti_dir: Path) -> pd.DataFrame:
+    """Three-subject file table over `temp_nifti_dir`, built once (READ-ONLY)."""
+    return pd.DataFrame.from_records(
+        [
+            {
+                "subject_id": f"sub-{i:03d}",
+                "t1w": str(temp_nifti_dir / f"sub-{i:03d}_T1w.nii.gz"),
+                "age": age,
+            }
+            for i, age in enumerate([25.0, 30.0, 35.0])
+        ]
+    )
+
+
 class TestValidateFileTableColumns:
     """Tests for validate_file_table_columns function."""
 
-    def test_valid_columns(self, simple_features: Features) -> None:
+    def test_valid_columns(self, nifti_file_table: pd.DataFrame, simple_features: Features) -> None:
         """Test that validation passes when all columns are present."""
-        file_table = pd.DataFrame(
-            {
-                "subject_id": ["sub-001", "sub-002"],
-                "t1w": ["path/to/001.nii.gz", "path/to/002.nii.gz"],
-                "age": [25.0, 30.0],
-            }
-        )
-
         # Should not raise
-        validate_file_table_columns(file_table, simple_features)
+        validate_file_table_columns(nifti_file_table, simple_features)
 
-    def test_extra_columns_allowed(self, simple_features: Features) -> None:
+    def test_extra_columns_allowed(
+        self, nifti_file_table: pd.DataFrame, simple_features: Features
+    ) -> None:
         """Test that extra columns in file_table are allowed."""
-        file_table = pd.DataFrame(
-            {
-                "subject_id": ["sub-001"],
-                "t1w": ["path/to/001.nii.gz"],
-                "age": [25.0],
-                "extra_column": ["extra_value"],  # Not in features
-            }
-        )
+        # assign() returns a new frame; the shared table is not modified
+        file_table = nifti_file_table.assign(extra_column="extra_value")  # Not in features
 
         # Should not raise
         validate_file_table_columns(file_table, simple_features)
@@ -110,31 +122,11 @@ class TestBuildHfDataset:
     def test_build_dataset_returns_dataset(
         self,
         dummy_config: DatasetBuilderConfig,
-        temp_nifti_dir: Path,
+        nifti_file_table: pd.DataFrame,
+        simple_features: Features,
     ) -> None:
         """Test that build_hf_dataset returns a Dataset object."""
-        # Create file table with real NIfTI paths
-        file_table = pd.DataFrame(
-            {
-                "subject_id": ["sub-000", "sub-001", "sub-002"],
-                "t1w": [
-                    str(temp_nifti_dir / "sub-000_T1w.nii.gz"),
-                    str(temp_nifti_dir / "sub-001_T1w.nii.gz"),
-                    str(temp_nifti_dir / "sub-002_T1w.nii.gz"),
-                ],
-                "age": [25.0, 30.0, 35.0],
-            }
-        )
-
-        features = Features(
-            {
-                "subject_id": Value("string"),
-                "t1w": Nifti(),
-                "age": Value("float32"),
-            }
-        )
-
-        ds = build_hf_dataset(dummy_config, file_table, features)
+        ds = build_hf_dataset(dummy_config, nifti_file_table, simple_features)
 
         assert isinstance(ds, Dataset)
         assert len(ds) == 3
@@ -142,82 +134,35 @@ class TestBuildHfDataset:
     def test_build_dataset_has_correct_columns(
         self,
         dummy_config: DatasetBuilderConfig,
-        temp_nifti_dir: Path,
+        nifti_file_table: pd.DataFrame,
+        simple_features: Features,
     ) -> None:
         """Test that the resulting dataset has the expected columns."""
-        file_table = pd.DataFrame(
-            {
-                "subject_id": ["sub-000", "sub-001"],
-                "t1w": [
-                    str(temp_nifti_dir / "sub-000_T1w.nii.gz"),
-                    str(temp_nifti_dir / "sub-001_T1w.nii.gz"),
-                ],
-                "age": [25.0, 30.0],
-            }
-        )
-
-        features = Features(
-            {
-                "subject_id": Value("string"),
-                "t1w": Nifti(),
-                "age": Value("float32"),
-            }
-        )
-
-        ds = build_hf_dataset(dummy_config, file_table, features)
+        ds = build_hf_dataset(dummy_config, nifti_file_table, simple_features)
 
         assert set(ds.column_names) == {"subject_id", "t1w", "age"}
 
     def test_build_dataset_excludes_extra_columns(
         self,
         dummy_config: DatasetBuilderConfig,
-        temp_nifti_dir: Path,
+        nifti_file_table: pd.DataFrame,
+        simple_features: Features,
     ) -> None:
         """Test that columns not in features are excluded from the dataset."""
-        file_table = pd.DataFrame(
-            {
-                "subject_id": ["sub-000"],
-                "t1w": [str(temp_nifti_dir / "sub-000_T1w.nii.gz")],
-                "age": [25.0],
-                "extra_column": ["should_be_excluded"],
-            }
-        )
+        file_table = nifti_file_table.assign(extra_column="should_be_excluded")
 
-        features = Features(
-            {
-                "subject_id": Value("string"),
-                "t1w": Nifti(),
-                "age": Value("float32"),
-            }
-        )
-
-        ds = build_hf_dataset(dummy_config, file_table, features)
+        ds = build_hf_dataset(dummy_config, file_table, simple_features)
 
         assert "extra_column" not in ds.column_names
 
     def test_build_dataset_nifti_feature_type(
         self,
         dummy_config: DatasetBuilderConfig,
-        temp_nifti_dir: Path,
+        nifti_file_table: pd.DataFrame,
+        simple_features: Features,
     ) -> None:
         """Test that Nifti columns have the correct feature type."""
-        file_table = pd.DataFrame(
-            {
-                "subject_id": ["sub-000"],
-                "t1w": [str(temp_nifti_dir / "sub-000_T1w.nii.gz")],
-                "age": [25.0],
-            }
-        )
-
-        features = Features(
-            {
-                "subject_id": Value("string"),
-                "t1w": Nifti(),
-                "age": Value("float32"),
-            }
-        )
-
-        ds = build_hf_dataset(dummy_config, file_table, features)
+        ds = build_hf_dataset(dummy_config, nifti_file_table, simple_features)
 
         # Check that the t1w feature is a Nifti type
         assert isinstance(ds.features["t1w"], Nifti)
@@ -225,26 +170,11 @@ class TestBuildHfDataset:
     def test_build_dataset_can_load_nifti(
         self,
         dummy_config: DatasetBuilderConfig,
-        temp_nifti_dir: Path,
+        nifti_file_table: pd.DataFrame,
+        simple_features: Features,
     ) -> None:
         """Test that NIfTI files can be loaded from the dataset."""
-        file_table = pd.DataFrame(
-            {
-                "subject_id": ["sub-000"],
-                "t1w": [str(temp_nifti_dir / "sub-000_T1w.nii.gz")],
-                "age": [25.0],
-            }
-        )
-
-        features = Features(
-            {
-                "subject_id": Value("string"),
-                "t1w": Nifti(),
-                "age": Value("float32"),
-            }
-        )
-
-        ds = build_hf_dataset(dummy_config, file_table, features)
+        ds = build_hf_dataset(dummy_config, nifti_file_table, simple_features)
 
         # Access the first example's NIfTI image
         example = ds[0]
@@ -253,10 +183,10 @@ class TestBuildHfDataset:
         # Should be a nibabel Nifti1Image
         assert isinstance(nifti_img, nib.nifti1.Nifti1Image)
 
-        # Check we can get the data
-        data = nifti_img.get_fdata()
+        # Check we can get the data (dataobj keeps the on-disk float32, no float64 copy)
+        data = np.asanyarray(nifti_img.dataobj)
         assert data.shape == (2, 2, 2)
-        assert np.allclose(data, 1.0)  # First subject has all 1s
+        assert np.all(data == 1)  # First subject has all 1s
 
 
 class TestDatasetBuilderConfig:
@@ -287,80 +217,106 @@ class TestDatasetBuilderConfig:
         assert config.dry_run is True
 
 
+# Stand-in for embed_table_storage output in the sharded-push test (read-only)
+_DUMMY_TABLE = pa.table({"col": [1]})
+
+
+@pytest.fixture
+def mocked_hub() -> Generator[SimpleNamespace, None, None]:
+    """Patch the sharded-upload collaborators in bids_hub.core.builder.
+
+    Yields `api` (the HfApi instance), `embed` (embed_table_storage, returning
+    `_DUMMY_TABLE`) and `write` (pq.write_table, which just touches the path so
+    the builder's unlink() works).
+    """
+
+    def create_dummy_file(table: pa.Table, path: str) -> None:
+        Path(path).touch()
+
+    with (
+        patch.multiple(
+            "bids_hub.core.builder", HfApi=DEFAULT, embed_table_storage=DEFAULT
+        ) as builder_mocks,
+        patch("bids_hub.core.builder.pq.write_table", side_effect=create_dummy_file) as write,
+    ):
+        embed = builder_mocks["embed_table_storage"]
+        embed.return_value = _DUMMY_TABLE
+        yield SimpleNamespace(api=builder_mocks["HfApi"].return_value, embed=embed, write=write)
+
+
+class _PushRecorder:
+    """Dataset stand-in that records `push_to_hub` calls as (args, kwargs)."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def push_to_hub(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append((args, kwargs))
+
+
 class TestPushDatasetToHub:
     """Tests for push_dataset_to_hub function."""
 
     def test_push_dataset_to_hub_default_embeds_files(self) -> None:
         """Ensure embed_external_files defaults to True."""
-        from unittest.mock import Mock, patch
-
         config = DatasetBuilderConfig(
             bids_root=Path("/fake/path"),
             hf_repo_id="test/arc-aphasia",
         )
 
-        mock_ds = Mock()
-        with patch.object(mock_ds, "push_to_hub") as mock_push:
-            push_dataset_to_hub(mock_ds, config)
-            mock_push.assert_called_once()
-            # Verify embed_external_files=True was passed
-            assert mock_push.call_args[1]["embed_external_files"] is True
+        ds = _PushRecorder()
+        push_dataset_to_hub(cast(Dataset, ds), config)
+        assert len(ds.calls) == 1
+        # Verify embed_external_files=True was passed
+        assert ds.calls[0][1]["embed_external_files"] is True
 
     def test_push_dataset_to_hub_passes_repo_id(self) -> None:
         """Ensure the correct repo ID is passed to push_to_hub."""
-        from unittest.mock import Mock, patch
-
         config = DatasetBuilderConfig(
             bids_root=Path("/fake/path"),
             hf_repo_id="hugging-science/arc-aphasia-bids",
         )
 
-        mock_ds = Mock()
-        with patch.object(mock_ds, "push_to_hub") as mock_push:
-            push_dataset_to_hub(mock_ds, config)
-            mock_push.assert_called_once()
-            # First positional arg should be the repo ID
-            assert mock_push.call_args[0][0] == "hugging-science/arc-aphasia-bids"
+        ds = _PushRecorder()
+        push_dataset_to_hub(cast(Dataset, ds), config)
+        assert len(ds.calls) == 1
+        # First positional arg should be the repo ID
+        assert ds.calls[0][0][0] == "hugging-science/arc-aphasia-bids"
 
     def test_push_dataset_to_hub_explicit_false_allowed(self) -> None:
         """Ensure explicitly passing embed_external_files=False is allowed."""
-        from unittest.mock import Mock, patch
-
         config = DatasetBuilderConfig(
             bids_root=Path("/fake/path"),
             hf_repo_id="test/arc-aphasia",
         )
 
-        mock_ds = Mock()
-        with patch.object(mock_ds, "push_to_hub") as mock_push:
-            # Explicitly passing False is allowed (for local-only testing)
-            push_dataset_to_hub(mock_ds, config, embed_external_files=False)
-            mock_push.assert_called_once()
-            assert mock_push.call_args[1]["embed_external_files"] is False
+        ds = _PushRecorder()
+        # Explicitly passing False is allowed (for local-only testing)
+        push_dataset_to_hub(cast(Dataset, ds), config, embed_external_files=False)
+        assert len(ds.calls) == 1
+        assert ds.calls[0][1]["embed_external_files"] is False
 
     def test_push_dataset_to_hub_passes_extra_kwargs(self) -> None:
         """Ensure additional kwargs are passed through to push_to_hub."""
-        from unittest.mock import Mock, patch
-
         config = DatasetBuilderConfig(
             bids_root=Path("/fake/path"),
             hf_repo_id="test/arc-aphasia",
         )
 
-        mock_ds = Mock()
-        with patch.object(mock_ds, "push_to_hub") as mock_push:
-            push_dataset_to_hub(mock_ds, config, private=True, commit_message="test")
-            mock_push.assert_called_once()
-            assert mock_push.call_args[1]["private"] is True
-            assert mock_push.call_args[1]["commit_message"] == "test"
+        ds = _PushRecorder()
+        push_dataset_to_hub(cast(Dataset, ds), config, private=True, commit_message="test")
+        assert len(ds.calls) == 1
+        assert ds.calls[0][1]["private"] is True
+        assert ds.calls[0][1]["commit_message"] == "test"
 
-    def test_push_dataset_to_hub_custom_sharded_logic(self, temp_nifti_dir: Path) -> None:
+    def test_push_dataset_to_hub_custom_sharded_logic(
+        self,
+        temp_nifti_dir: Path,
+        mocked_hub: SimpleNamespace,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Ensure custom sharding logic is triggered when num_shards > 1."""
-        import shutil
-        from unittest.mock import patch
-
-        import pyarrow as pa
-
         config = DatasetBuilderConfig(
             bids_root=Path("/fake/path"),
             hf_repo_id="test/arc-aphasia",
@@ -380,58 +336,40 @@ class TestPushDatasetToHub:
                     str(temp_nifti_dir / "sub-000_T1w.nii.gz"),
                     str(temp_nifti_dir / "sub-001_T1w.nii.gz"),
                 ],
-            }
-        ).cast(features)
-
-        # Clean up any leftover staging dir from previous test runs
-        staging_dir = Path("./hf_upload_staging")
-        if staging_dir.exists():
-            shutil.rmtree(staging_dir)
-
-        # Mock HfApi and pq.write_table
-        with (
-            patch("bids_hub.core.builder.HfApi") as MockApi,
-            patch("bids_hub.core.builder.embed_table_storage") as mock_embed,
-            patch("bids_hub.core.builder.pq.write_table") as mock_write,
-        ):
-            mock_api_instance = MockApi.return_value
-            # embed_table_storage returns a simple table
-            mock_embed.return_value = pa.table({"col": [1]})
-
-            # Side effect for write_table to create the file so unlink() works
-            def create_dummy_file(table: pa.Table, path: str) -> None:
-                Path(path).touch()
-
-            mock_write.side_effect = create_dummy_file
-
-            # Remote verification: all expected files are present in repo after upload
-            mock_api_instance.list_repo_files.return_value = [
-                "dataset_info.json",
-                "data/train-00000-of-00002.parquet",
-                "data/train-00001-of-00002.parquet",
-            ]
-
-            # Call with num_shards=2 using real dataset
-            push_dataset_to_hub(real_ds, config, num_shards=2)
-
-            # Verify create_repo called with explicit private parameter
-            mock_api_instance.create_repo.assert_called_once_with(
-                "test/arc-aphasia", repo_type="dataset", private=False, exist_ok=True
-            )
-
-            # Verify embed_table_storage called twice (once per shard)
-            assert mock_embed.call_count == 2
-
-            # Verify pq.write_table called twice
-            assert mock_write.call_count == 2
-
-            # Verify upload_large_folder called (bulk upload instead of per-shard)
-            mock_api_instance.upload_large_folder.assert_called_once()
-
-            # Verify remote verification was performed
-            mock_api_instance.list_repo_files.assert_called()
-
-        # Clean up staging directory after test (since we no longer auto-delete)
-        # See BUG-004: We don't auto-delete to avoid race with HF retry logic
-        if staging_dir.exists():
-            shutil.rmtree(staging_dir)
+            },
+            features=features,
+        )
+
+        # The builder stages shards under ./hf_upload_staging; keep that inside tmp_path
+        # (auto-cleaned, and private to this test under xdist)
+        monkeypatch.chdir(tmp_path)
+
+        # Remote verification: all expected files are present in repo after upload
+        mocked_hub.api.list_repo_files.return_value = [
+            "dataset_info.json",
+            "data/train-00000-of-00002.parquet",
+            "data/train-00001-of-00002.parquet",
+        ]
+
+        # Call with num_shards=2 using real dataset
+        push_dataset_to_hub(real_ds, config, num_shards=2)
+
+        # Verify create_repo called with explicit private parameter
+        mocked_hub.api.create_repo.assert_called_once_with(
+            "test/arc-aphasia", repo_type="dataset", private=False, exist_ok=True
+        )
+
+        # Verify embed_table_storage called twice (once per shard)
+        assert mocked_hub.embed.call_count == 2
+
+        # Verify pq.write_table called twice
+        assert mocked_hub.write.call_count == 2
+
+        # Verify upload_large_folder called (bulk upload instead of per-shard)
+        mocked_hub.api.upload_large_folder.assert_called_once()
+
+        # Verify remote verification was performed
+        mocked_hub.api.list_repo_files.assert_called()
+
+        # Staging stays on disk (BUG-004: no auto-delete), here under tmp_path
+        assert (tmp_path / "hf_upload_staging").is_dir()
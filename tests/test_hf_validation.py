@@ -6,9 +6,11 @@ operate on Arrow data (no full decode) unless explicitly requested.
 
 from __future__ import annotations
 
+import pytest
 from datasets import Dataset, Features, Nifti, Sequence, Value
 
 from bids_hub.validation import (
+    check_column_counts,
     check_list_alignment,
     check_list_sessions,
     check_non_null_count,
@@ -17,6 +19,7 @@ from bids_hub.validation import (
     check_total_list_items,
     check_unique_values,
 )
+from tests.conftest import nifti_gz_bytes
 
 
 def _mock_hf_dataset(*, misalign: bool = False) -> Dataset:
@@ -109,3 +112,225 @@ def test_check_list_alignment_includes_row_ids_on_failure() -> None:
     assert check.passed is False
     assert "subject_id=sub-3" in check.details
     assert "session_id=ses-2" in check.details
+
+
+def test_column_checks_accept_arrow_table() -> None:
+    table = _mock_hf_dataset().data.table
+
+    assert check_schema(table, ["subject_id", "session_id", "img", "runs", "runs_meta"]).passed
+    assert check_row_count(table, expected=3).passed
+    assert check_unique_values(table, "subject_id", expected=3).passed
+    assert check_non_null_count(table, "img", expected=2).passed
+    assert check_list_sessions(table, "runs", expected=2).passed
+    assert check_total_list_items(table, "runs", expected=3).passed
+    assert check_list_alignment(table, ["runs", "runs_meta"]).passed
+
+
+def test_scan_hf_columns_computes_all_reductions_in_one_call() -> None:
+    from bids_hub.validation.hf import _scan_hf_columns
+
+    ds = _mock_hf_dataset()
+    scan = _scan_hf_columns(
+        ds,
+        {
+            "subject_id": ["unique"],
+            "img": ["non_null"],
+            "runs": ["list_sessions", "list_total"],
+        },
+    )
+
+    assert scan == {
+        ("subject_id", "unique"): 3,
+        ("img", "non_null"): 2,
+        ("runs", "list_sessions"): 2,
+        ("runs", "list_total"): 3,
+    }
+
+
+def test_check_column_counts_matches_single_column_helpers() -> None:
+    ds = _mock_hf_dataset()
+
+    checks = check_column_counts(
+        ds,
+        [
+            ("subject_id", "unique", 3),
+            ("img", "non_null", 2),
+            ("runs", "list_sessions", 2),
+            ("runs", "list_total", 4),
+        ],
+    )
+
+    assert checks == [
+        check_unique_values(ds, "subject_id", expected=3),
+        check_non_null_count(ds, "img", expected=2),
+        check_list_sessions(ds, "runs", expected=2),
+        check_total_list_items(ds, "runs", expected=4),
+    ]
+    assert [c.passed for c in checks] == [True, True, True, False]
+
+
+def test_check_shapes_batched_returns_only_error_strings() -> None:
+    from types import SimpleNamespace
+
+    from bids_hub.validation.arc import _check_shapes_batched
+
+    vol3d = SimpleNamespace(shape=(2, 2, 2))
+    vol4d = SimpleNamespace(shape=(2, 2, 2, 5))
+    out = _check_shapes_batched(
+        {
+            "subject_id": ["sub-1", "sub-2", "sub-3"],
+            "session_id": ["ses-1", "ses-1", "ses-1"],
+            "t1w": [[vol3d], [vol4d], []],
+            "bold_naming40": [[vol4d], [], [vol3d]],
+        }
+    )
+
+    errors = out["nifti_error"]
+    assert errors[0] == ""
+    assert "sub-2/ses-1 t1w[0]" in errors[1]
+    assert "sub-3/ses-1 bold_naming40[0]" in errors[2]
+
+
+def test_check_unique_values_on_multi_chunk_dictionary_column() -> None:
+    import pyarrow as pa
+
+    col = pa.chunked_array(
+        [
+            pa.array(["sub-1", "sub-2"]).dictionary_encode(),
+            pa.array(["sub-2", "sub-3"]).dictionary_encode(),
+        ]
+    )
+    table = pa.table({"subject_id": col})
+
+    assert check_unique_values(table, "subject_id", expected=3).passed
+
+
+def test_null_and_list_counts_span_chunks() -> None:
+    import pyarrow as pa
+
+    table = pa.table(
+        {
+            "img": pa.chunked_array([[b"x", None], [None, b"y", b"z"]]),
+            "runs": pa.chunked_array([[["a"], None], [[], ["b", "c"], None]]),
+        }
+    )
+
+    assert check_non_null_count(table, "img", expected=3).passed
+    assert check_list_sessions(table, "runs", expected=2).passed
+    assert check_total_list_items(table, "runs", expected=3).passed
+
+
+def test_package_reexports_are_the_arrow_helpers() -> None:
+    import bids_hub.validation as validation
+    from bids_hub.validation import hf
+
+    for name in (
+        "check_column_counts",
+        "check_list_alignment",
+        "check_list_sessions",
+        "check_non_null_count",
+        "check_row_count",
+        "check_schema",
+        "check_total_list_items",
+        "check_unique_values",
+    ):
+        assert getattr(validation, name) is getattr(hf, name)
+        assert name in validation.__all__
+
+
+def test_check_list_alignment_reports_total_beyond_sample_limit() -> None:
+    import pyarrow as pa
+
+    table = pa.table(
+        {
+            "a": [[1], [1, 2], [1, 2], [1, 2]],
+            "b": [[1], [1], [1], [1]],
+        }
+    )
+
+    check = check_list_alignment(table, ["a", "b"], sample_limit=1)
+    assert check.passed is False
+    assert check.actual == "3 misaligned rows"
+    assert check.details == "Row 1: a=2, b=1"
+
+
+def test_hf_validation_result_summary() -> None:
+    from bids_hub.validation import HFValidationCheck, HFValidationResult
+
+    result = HFValidationResult(dataset_name="org/ds")
+    result.add(HFValidationCheck("schema", "3 columns", "3 columns", True))
+    result.add(HFValidationCheck("row_count", "10", "9", False, details="one short"))
+
+    assert result.summary().splitlines() == [
+        "HuggingFace Validation Results for: org/ds",
+        "=" * 60,
+        "✅ PASS schema",
+        "❌ FAIL row_count",
+        "       Expected: 10",
+        "       Actual:   9",
+        "       Details:  one short",
+        "=" * 60,
+        "❌ 1/2 checks failed.",
+    ]
+
+
+def test_hf_validation_dataclasses_are_slotted() -> None:
+    import pickle
+
+    from bids_hub.validation import HFValidationCheck, HFValidationResult
+
+    check = HFValidationCheck("schema", "1", "1", True)
+    result = HFValidationResult(dataset_name="org/ds", checks=[check])
+
+    assert not hasattr(check, "__dict__")
+    assert not hasattr(result, "__dict__")
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_check_unique_values_counts_null_as_a_value() -> None:
+    import pyarrow as pa
+
+    table = pa.table({"subject_id": pa.chunked_array([["sub-1", None], ["sub-1", "sub-2"]])})
+
+    assert check_unique_values(table, "subject_id", expected=3).passed
+
+
+@pytest.mark.parametrize("num_proc", [1, 2])
+def test_check_nifti_loadable_batched_scans_every_row(num_proc: int) -> None:
+    import gzip
+
+    import nibabel as nib
+    import numpy as np
+
+    from bids_hub.validation.arc import _check_nifti_loadable_batched
+
+    vol3d = {"path": "t1w.nii.gz", "bytes": nifti_gz_bytes()}
+    bold = nib.Nifti1Image(np.ones((2, 2, 2, 3), dtype=np.float32), np.eye(4)).to_bytes()
+    vol4d = {"path": "bold.nii.gz", "bytes": gzip.compress(bold, compresslevel=1)}
+    features = Features(
+        {
+            "subject_id": Value("string"),
+            "session_id": Value("string"),
+            "t1w": Sequence(Nifti()),
+            "bold_naming40": Sequence(Nifti()),
+        }
+    )
+    ds = Dataset.from_dict(
+        {
+            "subject_id": ["sub-1", "sub-2", "sub-3", "sub-4"],
+            "session_id": ["ses-1"] * 4,
+            "t1w": [[vol3d], [vol3d, vol3d], [], [vol4d]],
+            "bold_naming40": [[vol4d], [], [vol4d], [vol3d]],
+        },
+        features=features,
+    )
+
+    passed = _check_nifti_loadable_batched(ds.select(range(3)), num_proc=num_proc)
+    assert passed.passed
+    assert passed.actual == "3 checked, all OK"
+
+    failed = _check_nifti_loadable_batched(ds, num_proc=num_proc)
+    assert not failed.passed
+    assert failed.actual == "1 rows with errors"
+    assert "sub-4/ses-1 t1w[0]" in failed.details
+    assert "sub-4/ses-1 bold_naming40[0]" in failed.details
@@ -7,11 +7,10 @@ and flattened schema handling.
 
 import tempfile
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import nibabel as nib
-import numpy as np
 import pandas as pd
 import pytest
 from datasets import Features, Nifti, Sequence
@@ -22,19 +21,23 @@ from bids_hub import (
     get_isles24_features,
 )
 from bids_hub.core import DatasetBuilderConfig
+from tests.conftest import MINIMAL_NII_GZ_BYTES
+
+# Keep this module on one xdist worker so the session-scoped fixture is built once
+pytestmark = [
+    pytest.mark.xdist_group("isles24"),
+    # The NIfTI fixtures call nibabel heavily; keep its deprecation noise out of the report
+    pytest.mark.filterwarnings("ignore::DeprecationWarning:nibabel.*"),
+]
 
 
 def _create_minimal_nifti(path: Path) -> None:
-    """Create a minimal valid NIfTI file at the given path."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    data = np.ones((2, 2, 2), dtype=np.float32)
-    img = nib.Nifti1Image(data, np.eye(4))
-    nib.save(img, path)
+    """Create a minimal valid NIfTI file at the given path (parent dir must exist)."""
+    path.write_bytes(MINIMAL_NII_GZ_BYTES)
 
 
-@pytest.fixture
-def synthetic_isles24_root() -> Generator[Path, None, None]:
-    """Create a synthetic ISLES'24 dataset for testing.
+def _populate_isles24(root: Path) -> None:
+    """Populate `root` with a synthetic ISLES'24 dataset.
 
     Structure (flattened ISLES24 layout):
         isles24_train/
@@ -59,101 +62,97 @@ def synthetic_isles24_root() -> Generator[Path, None, None]:
                     ├── {sub}_space-ncct_adc.nii.gz
                     └── {sub}_space-ncct_lesion-msk.nii.gz
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir) / "isles24_train"
-        root.mkdir()
-        rawdata = root / "raw_data"
-        derivatives = root / "derivatives"
-
-        # Create participants.tsv
-        participants = pd.DataFrame(
-            {
-                "participant_id": ["sub-stroke0001", "sub-stroke0002", "sub-stroke0003"],
-                "age": [65.0, 72.5, 55.0],
-                "sex": ["M", "F", "F"],
-                "nihss_admission": [12.0, 8.0, 15.0],
-                "mrs_3months": [2.0, 1.0, 4.0],
-                "thrombolysis": ["Yes", "No", "Yes"],
-                "thrombectomy": ["No", "Yes", "No"],
-            }
-        )
-        participants.to_csv(root / "participants.tsv", sep="\t", index=False)
+    rawdata = root / "raw_data"
+    derivatives = root / "derivatives"
+
+    # Create participants.tsv
+    participants = pd.DataFrame(
+        {
+            "participant_id": ["sub-stroke0001", "sub-stroke0002", "sub-stroke0003"],
+            "age": [65.0, 72.5, 55.0],
+            "sex": ["M", "F", "F"],
+            "nihss_admission": [12.0, 8.0, 15.0],
+            "mrs_3months": [2.0, 1.0, 4.0],
+            "thrombolysis": ["Yes", "No", "Yes"],
+            "thrombectomy": ["No", "Yes", "No"],
+        }
+    )
+    participants.to_csv(root / "participants.tsv", sep="\t", index=False)
 
+    s1 = "sub-stroke0001"
+    s2 = "sub-stroke0002"
+    nifti_paths = [
         # --- Subject 1: Full Data ---
-        s1 = "sub-stroke0001"
-
         # Raw ses-01 (Flat structure)
-        _create_minimal_nifti(rawdata / s1 / "ses-01" / f"{s1}_ses-01_ncct.nii.gz")
-        _create_minimal_nifti(rawdata / s1 / "ses-01" / f"{s1}_ses-01_cta.nii.gz")
-        _create_minimal_nifti(rawdata / s1 / "ses-01" / f"{s1}_ses-01_ctp.nii.gz")
-
-        # Raw ses-02 (Flat structure for DWI/ADC? implementation uses derivatives for DWI/ADC, wait.
-        # Implementation:
-        #   ses02_deriv = deriv_subject_dir / "ses-02"
-        #   dwi = _find_single_nifti(ses02_deriv, "*_space-ncct_dwi.nii.gz")
-        # So DWI/ADC are expected in DERIVATIVES ses-02, not rawdata.
-        # But wait, looking at my read of isles24.py:
-        #   dwi = _find_single_nifti(ses02_deriv, "*_space-ncct_dwi.nii.gz")
-        # Yes, dwi is in derivatives.
-        # But the original test fixture put them in rawdata/s1/ses-02/dwi.
-        # So I need to move DWI/ADC to derivatives/s1/ses-02/.
-
-        # Checking isles24.py again.
-        # ses02_deriv = deriv_subject_dir / "ses-02"
-        # dwi = _find_single_nifti(ses02_deriv, "*_space-ncct_dwi.nii.gz")
-
-        # Okay, I will update the fixture to put DWI/ADC in derivatives/ses-02/ and flattened.
-
-        _create_minimal_nifti(derivatives / s1 / "ses-02" / f"{s1}_space-ncct_dwi.nii.gz")
-        _create_minimal_nifti(derivatives / s1 / "ses-02" / f"{s1}_space-ncct_adc.nii.gz")
-
+        rawdata / s1 / "ses-01" / f"{s1}_ses-01_ncct.nii.gz",
+        rawdata / s1 / "ses-01" / f"{s1}_ses-01_cta.nii.gz",
+        rawdata / s1 / "ses-01" / f"{s1}_ses-01_ctp.nii.gz",
+        # DWI/ADC are read from DERIVATIVES ses-02 (flattened), not raw_data
+        derivatives / s1 / "ses-02" / f"{s1}_space-ncct_dwi.nii.gz",
+        derivatives / s1 / "ses-02" / f"{s1}_space-ncct_adc.nii.gz",
         # Derivatives ses-01 (Perfusion)
-        perf_dir = derivatives / s1 / "ses-01" / "perfusion-maps"
-        _create_minimal_nifti(perf_dir / f"{s1}_space-ncct_tmax.nii.gz")
-        _create_minimal_nifti(perf_dir / f"{s1}_space-ncct_mtt.nii.gz")
-        _create_minimal_nifti(perf_dir / f"{s1}_space-ncct_cbf.nii.gz")
-        _create_minimal_nifti(perf_dir / f"{s1}_space-ncct_cbv.nii.gz")
+        derivatives / s1 / "ses-01" / "perfusion-maps" / f"{s1}_space-ncct_tmax.nii.gz",
+        derivatives / s1 / "ses-01" / "perfusion-maps" / f"{s1}_space-ncct_mtt.nii.gz",
+        derivatives / s1 / "ses-01" / "perfusion-maps" / f"{s1}_space-ncct_cbf.nii.gz",
+        derivatives / s1 / "ses-01" / "perfusion-maps" / f"{s1}_space-ncct_cbv.nii.gz",
+        # Derivatives ses-01 (Masks): directly in ses-01 (flattened)
+        derivatives / s1 / "ses-01" / f"{s1}_space-ncct_lvo-msk.nii.gz",
+        derivatives / s1 / "ses-01" / f"{s1}_space-ncct_cow-msk.nii.gz",
+        # Derivatives ses-02 (Lesion)
+        derivatives / s1 / "ses-02" / f"{s1}_space-ncct_lesion-msk.nii.gz",
+        # --- Subject 2: Partial Data (Missing CTP, Perfusion Maps and LVO) ---
+        rawdata / s2 / "ses-01" / f"{s2}_ses-01_ncct.nii.gz",
+        rawdata / s2 / "ses-01" / f"{s2}_ses-01_cta.nii.gz",
+        derivatives / s2 / "ses-02" / f"{s2}_space-ncct_dwi.nii.gz",
+        derivatives / s2 / "ses-02" / f"{s2}_space-ncct_adc.nii.gz",
+        derivatives / s2 / "ses-02" / f"{s2}_space-ncct_lesion-msk.nii.gz",
+        # --- Subject 3: No Imaging Data (Only in Participants) ---
+        # Should be excluded
+    ]
 
-        # Derivatives ses-01 (Masks)
-        # Implementation: lvo_mask = _find_single_nifti(ses01_deriv, "*_space-ncct_lvo-msk.nii.gz")
-        # So lvo_mask is directly in ses01_deriv (flattened)
-        _create_minimal_nifti(derivatives / s1 / "ses-01" / f"{s1}_space-ncct_lvo-msk.nii.gz")
+    # Create directories serially up front, then write the independent files in parallel
+    for directory in {path.parent for path in nifti_paths}:
+        directory.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_create_minimal_nifti, nifti_paths))
 
-        # cow_seg = _find_single_nifti(ses01_deriv, "*_space-ncct_cow-msk.nii.gz")
-        _create_minimal_nifti(derivatives / s1 / "ses-01" / f"{s1}_space-ncct_cow-msk.nii.gz")
 
-        # Derivatives ses-02 (Lesion)
-        # Pattern: *_space-ncct_lesion-msk.nii.gz
-        _create_minimal_nifti(derivatives / s1 / "ses-02" / f"{s1}_space-ncct_lesion-msk.nii.gz")
+@pytest.fixture(scope="session")
+def synthetic_isles24_root() -> Generator[Path, None, None]:
+    """Synthetic ISLES'24 dataset (see `_populate_isles24`), built once per session.
 
-        # --- Subject 2: Partial Data (Missing CTP and LVO) ---
-        s2 = "sub-stroke0002"
-        _create_minimal_nifti(rawdata / s2 / "ses-01" / f"{s2}_ses-01_ncct.nii.gz")
-        _create_minimal_nifti(rawdata / s2 / "ses-01" / f"{s2}_ses-01_cta.nii.gz")
-        # Missing CTP
-        # Missing Perfusion Maps
+    Shared by every test: treat it as READ-ONLY.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "isles24_train"
+        root.mkdir()
+        _populate_isles24(root)
+        yield root
 
-        _create_minimal_nifti(derivatives / s2 / "ses-02" / f"{s2}_space-ncct_dwi.nii.gz")
-        _create_minimal_nifti(derivatives / s2 / "ses-02" / f"{s2}_space-ncct_adc.nii.gz")
-        _create_minimal_nifti(derivatives / s2 / "ses-02" / f"{s2}_space-ncct_lesion-msk.nii.gz")
 
-        # --- Subject 3: No Imaging Data (Only in Participants) ---
-        # Should be excluded
+@pytest.fixture(scope="session")
+def isles24_file_table(synthetic_isles24_root: Path) -> pd.DataFrame:
+    """File table built once from the shared synthetic tree (READ-ONLY)."""
+    return build_isles24_file_table(synthetic_isles24_root)
 
-        yield root
+
+@pytest.fixture(scope="session")
+def isles24_rows(isles24_file_table: pd.DataFrame) -> dict[str, pd.Series]:
+    """Rows of `isles24_file_table` keyed by subject_id (READ-ONLY)."""
+    return dict(isles24_file_table.set_index("subject_id", drop=False).iterrows())
 
 
 class TestBuildISLES24FileTable:
     """Tests for build_isles24_file_table function."""
 
-    def test_build_returns_dataframe(self, synthetic_isles24_root: Path) -> None:
+    def test_build_returns_dataframe(self, isles24_file_table: pd.DataFrame) -> None:
         """Test that it returns a pandas DataFrame."""
-        df = build_isles24_file_table(synthetic_isles24_root)
+        df = isles24_file_table
         assert isinstance(df, pd.DataFrame)
 
-    def test_correct_columns(self, synthetic_isles24_root: Path) -> None:
+    def test_correct_columns(self, isles24_file_table: pd.DataFrame) -> None:
         """Test that all required columns are present."""
-        df = build_isles24_file_table(synthetic_isles24_root)
+        df = isles24_file_table
         expected_cols = {
             "subject_id",
             "ncct",
@@ -176,10 +175,9 @@ class TestBuildISLES24FileTable:
         }
         assert set(df.columns) == expected_cols
 
-    def test_flattens_sessions(self, synthetic_isles24_root: Path) -> None:
+    def test_flattens_sessions(self, isles24_rows: dict[str, pd.Series]) -> None:
         """Test that ses-01 (Acute) and ses-02 (Follow-up) are in ONE row."""
-        df = build_isles24_file_table(synthetic_isles24_root)
-        s1 = df[df["subject_id"] == "sub-stroke0001"].iloc[0]
+        s1 = isles24_rows["sub-stroke0001"]
 
         # Ses-01 data
         assert s1["ncct"] is not None
@@ -193,19 +191,17 @@ class TestBuildISLES24FileTable:
         assert "sub-stroke0001" in s1["ncct"]
         assert "sub-stroke0001" in s1["lesion_mask"]
 
-    def test_full_subject_has_all_paths(self, synthetic_isles24_root: Path) -> None:
+    def test_full_subject_has_all_paths(self, isles24_rows: dict[str, pd.Series]) -> None:
         """Test that a subject with all files has no None values."""
-        df = build_isles24_file_table(synthetic_isles24_root)
-        s1 = df[df["subject_id"] == "sub-stroke0001"].iloc[0]
+        s1 = isles24_rows["sub-stroke0001"]
 
         for col in ["ncct", "cta", "ctp", "tmax", "dwi", "adc", "lesion_mask", "lvo_mask"]:
             assert s1[col] is not None
             assert Path(s1[col]).exists()
 
-    def test_partial_subject_has_nones(self, synthetic_isles24_root: Path) -> None:
+    def test_partial_subject_has_nones(self, isles24_rows: dict[str, pd.Series]) -> None:
         """Test that missing optional files result in None."""
-        df = build_isles24_file_table(synthetic_isles24_root)
-        s2 = df[df["subject_id"] == "sub-stroke0002"].iloc[0]
+        s2 = isles24_rows["sub-stroke0002"]
 
         assert s2["ncct"] is not None
         assert s2["ctp"] is None  # Missing
@@ -217,9 +213,9 @@ class TestBuildISLES24FileTable:
         with pytest.raises(ValueError, match="raw_data directory not found"):
             build_isles24_file_table(tmp_path)
 
-    def test_excludes_empty_subjects(self, synthetic_isles24_root: Path) -> None:
+    def test_excludes_empty_subjects(self, isles24_file_table: pd.DataFrame) -> None:
         """Test that subjects with no imaging data are excluded."""
-        df = build_isles24_file_table(synthetic_isles24_root)
+        df = isles24_file_table
         # sub-stroke0003 has no data folders
         assert "sub-stroke0003" not in df["subject_id"].values
 
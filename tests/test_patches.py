@@ -2,34 +2,59 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Generator
 from pathlib import Path
 
 import nibabel as nib
 import numpy as np
 import pytest
 
+from tests.conftest import MINIMAL_NII_GZ_BYTES
+
 
 @pytest.fixture
 def nifti_file(tmp_path: Path) -> Path:
     path = tmp_path / "test.nii.gz"
-    data = np.ones((2, 3, 4), dtype=np.float32)
-    img = nib.Nifti1Image(data, affine=np.eye(4))
-    nib.save(img, path)
+    path.write_bytes(MINIMAL_NII_GZ_BYTES)
     return path
 
 
-@pytest.fixture(autouse=True)
-def reset_nifti_wrapper_patch(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Ensure tests don't leak global monkey-patches between each other."""
+_SENTINEL = "_BIDS_HUB_NIFTI_LAZY_LOADING_PATCH_APPLIED"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def nifti_lazy_loading_patch() -> Generator[Callable[..., None], None, None]:
+    """Apply the patch once for this module; restore the unpatched wrapper afterwards.
+
+    Yields the original `Nifti1ImageWrapper.__init__`.
+    """
     import datasets.features.nifti as ds_nifti
 
+    from bids_hub import apply_nifti_lazy_loading_patch
+
     original_init = ds_nifti.Nifti1ImageWrapper.__init__
+    with pytest.MonkeyPatch.context() as mp:
+        # Registered so teardown undoes whatever the patch rebinds
+        mp.setattr(ds_nifti, _SENTINEL, False, raising=False)
+        mp.setattr(ds_nifti.Nifti1ImageWrapper, "__init__", original_init, raising=True)
+        apply_nifti_lazy_loading_patch()
+        yield original_init
+
+
+@pytest.fixture
+def reset_nifti_wrapper_patch(
+    nifti_lazy_loading_patch: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Temporarily un-apply the module-wide patch (for first-apply behaviour)."""
+    import datasets.features.nifti as ds_nifti
 
-    sentinel = "_BIDS_HUB_NIFTI_LAZY_LOADING_PATCH_APPLIED"
-    monkeypatch.setattr(ds_nifti, sentinel, False, raising=False)
-    monkeypatch.setattr(ds_nifti.Nifti1ImageWrapper, "__init__", original_init, raising=True)
+    monkeypatch.setattr(ds_nifti, _SENTINEL, False, raising=False)
+    monkeypatch.setattr(
+        ds_nifti.Nifti1ImageWrapper, "__init__", nifti_lazy_loading_patch, raising=True
+    )
 
 
+@pytest.mark.usefixtures("reset_nifti_wrapper_patch")
 def test_apply_nifti_lazy_loading_patch_is_idempotent() -> None:
     from bids_hub import apply_nifti_lazy_loading_patch
 
@@ -42,10 +67,6 @@ def test_decode_does_not_call_get_fdata_after_patch(
 ) -> None:
     from datasets.features import Nifti
 
-    from bids_hub import apply_nifti_lazy_loading_patch
-
-    apply_nifti_lazy_loading_patch()
-
     def _boom(*args: object, **kwargs: object) -> None:
         raise AssertionError("get_fdata() must not be called during decode")
 
@@ -59,10 +80,6 @@ def test_decode_does_not_call_get_fdata_after_patch(
 def test_dataobj_is_proxy_after_patch(nifti_file: Path) -> None:
     from datasets.features import Nifti
 
-    from bids_hub import apply_nifti_lazy_loading_patch
-
-    apply_nifti_lazy_loading_patch()
-
     feature = Nifti()
     decoded = feature.decode_example(feature.encode_example(str(nifti_file)))
     assert nib.is_proxy(decoded.dataobj)
@@ -71,13 +88,9 @@ def test_dataobj_is_proxy_after_patch(nifti_file: Path) -> None:
 def test_get_fdata_still_materializes_after_patch(nifti_file: Path) -> None:
     from datasets.features import Nifti
 
-    from bids_hub import apply_nifti_lazy_loading_patch
-
-    apply_nifti_lazy_loading_patch()
-
     feature = Nifti()
     decoded = feature.decode_example(feature.encode_example(str(nifti_file)))
     data = decoded.get_fdata()
 
     assert isinstance(data, np.ndarray)
-    assert data.shape == (2, 3, 4)
+    assert data.shape == (2, 2, 2)
@@ -21,10 +21,10 @@ from bids_hub.validation import (
 )
 
 
-@pytest.fixture
-def mock_bids_root(tmp_path: Path) -> Path:
-    """Create a minimal mock BIDS structure for testing."""
-    bids_root = tmp_path / "ds004884"
+@pytest.fixture(scope="module")
+def mock_bids_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a minimal mock BIDS structure, shared by the (read-only) tests using it."""
+    bids_root = tmp_path_factory.mktemp("bids") / "ds004884"
     bids_root.mkdir()
 
     # Required BIDS files
@@ -1,8 +1,13 @@
 """Tests for the generic validation framework."""
 
+import gzip
 import hashlib
+import json
+import os
+import shutil
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -11,16 +16,17 @@ from bids_hub.validation.base import (
     ValidationCheck,
     ValidationResult,
     check_count,
+    check_gzip_trailers,
     check_zero_byte_files,
     validate_dataset,
     verify_md5,
 )
 
 
-@pytest.fixture
-def mock_bids_root(tmp_path: Path) -> Generator[Path, None, None]:
-    """Create a mock BIDS structure."""
-    bids_root = tmp_path / "mock_bids"
+@pytest.fixture(scope="module")
+def mock_bids_root(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Create a mock BIDS structure, shared read-only across the module."""
+    bids_root = tmp_path_factory.mktemp("bids") / "mock_bids"
     bids_root.mkdir()
 
     # Subject 1: Complete
@@ -37,12 +43,29 @@ def mock_bids_root(tmp_path: Path) -> Generator[Path, None, None]:
     yield bids_root
 
 
+@pytest.fixture
+def mutable_bids_root(mock_bids_root: Path, tmp_path: Path) -> Path:
+    """Per-test copy of `mock_bids_root` for tests that modify the tree."""
+    return Path(shutil.copytree(mock_bids_root, tmp_path / "mock_bids"))
+
+
 def test_validation_check_creation() -> None:
     check = ValidationCheck("test", "A", "A", True)
     assert check.passed
     assert check.name == "test"
 
 
+def test_validation_check_and_config_are_frozen_slotted() -> None:
+    import dataclasses
+
+    check = ValidationCheck("test", "A", "A", True)
+    config = DatasetValidationConfig("ds", {}, [], {})
+    for obj in (check, config):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            obj.name = "other"  # type: ignore[misc]
+
+
 def test_validation_result_summary() -> None:
     res = ValidationResult(Path("/tmp"))
     res.add(ValidationCheck("ok", "1", "1", True))
@@ -53,6 +76,37 @@ def test_validation_result_summary() -> None:
     assert "1/2 checks failed" in summary
 
 
+def test_validation_result_counts() -> None:
+    res = ValidationResult(Path("/tmp"), checks=[ValidationCheck("ok", "1", "1", True)])
+    assert (res.passed_count, res.failed_count, res.skipped_count) == (1, 0, 0)
+    assert res.all_passed
+
+    res.add(ValidationCheck("skip", "x", "none", True, skipped=True))
+    res.add(ValidationCheck("fail", "1", "0", False))
+    assert (res.passed_count, res.failed_count, res.skipped_count) == (1, 1, 1)
+    assert not res.all_passed
+
+    # The list is public: direct mutation is reflected too
+    res.checks = [c for c in res.checks if c.passed]
+    assert res.all_passed
+    res.checks.extend([ValidationCheck("late", "1", "0", False)])
+    assert res.failed_count == 1
+    assert res["late"].name == "late"
+
+
+def test_validation_result_lookup_by_name() -> None:
+    first = ValidationCheck("dup", "1", "1", True)
+    res = ValidationResult(Path("/tmp"), checks=[first])
+    res.add(ValidationCheck("dup", "1", "0", False))
+    res.add(ValidationCheck("other", "1", "1", True))
+
+    assert res["dup"] is first  # first check wins, as with next(...)
+    assert res.by_name("other") is res.checks[-1]
+    assert res.by_name("missing") is None
+    with pytest.raises(KeyError):
+        res["missing"]
+
+
 def test_check_count() -> None:
     # Exact match
     c = check_count("test", 10, 10)
@@ -86,6 +140,101 @@ def test_verify_md5(tmp_path: Path) -> None:
     assert not verify_md5(f, "wronghash").passed
     # Missing
     assert not verify_md5(tmp_path / "missing", expected).passed
+    # Empty: answered from the size alone
+    empty = tmp_path / "empty.bin"
+    empty.touch()
+    assert verify_md5(empty, hashlib.md5(b"").hexdigest()).passed
+
+
+def test_md5_file_without_file_digest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from bids_hub.validation.base import _md5_file
+
+    # Python 3.10 has no hashlib.file_digest; the mmap fallback must agree
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    f = tmp_path / "test.bin"
+    f.write_bytes(b"hello world" * 1000)
+    assert _md5_file(f) == hashlib.md5(b"hello world" * 1000).hexdigest()
+
+    f.write_bytes(b"")
+    assert _md5_file(f) == hashlib.md5(b"").hexdigest()
+
+
+def test_md5_file_pipelined_matches_whole_file(tmp_path: Path) -> None:
+    from bids_hub.validation.base import _md5_file_pipelined
+
+    f = tmp_path / "test.bin"
+    content = bytes(range(256)) * 41  # not a multiple of the chunk size
+    f.write_bytes(content)
+    expected = hashlib.md5(content).hexdigest()
+
+    assert _md5_file_pipelined(f, chunk_size=1000) == expected
+    assert _md5_file_pipelined(f) == expected  # single chunk: sequential path
+    assert verify_md5(f, expected, parallel=True).passed
+
+
+def test_verify_md5_async(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bids_hub.validation import verify_md5_async
+
+    f = tmp_path / "test.bin"
+    f.write_bytes(b"hello world")
+    expected = hashlib.md5(b"hello world").hexdigest()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = verify_md5_async(f, expected, pool)
+        missing = verify_md5_async(tmp_path / "missing", expected, pool)
+        assert future.result() == verify_md5(f, expected)
+        assert missing.result().actual == "MISSING"
+
+
+def test_verify_md5_hashes_linked_copies_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from bids_hub.validation import base
+
+    hashed: list[Path] = []
+    md5_file = base._md5_file
+
+    def counting_md5_file(path: Path) -> str:
+        hashed.append(path)
+        return md5_file(path)
+
+    monkeypatch.setattr(base, "_md5_file", counting_md5_file)
+    f = tmp_path / "train.7z"
+    f.write_bytes(b"archive bytes")
+    (tmp_path / "mirror.7z").symlink_to(f)
+    expected = hashlib.md5(b"archive bytes").hexdigest()
+
+    assert verify_md5(f, expected).passed
+    assert verify_md5(tmp_path / "mirror.7z", expected).passed
+    assert hashed == [f]
+
+    f.write_bytes(b"new archive bytes")  # rewritten: new identity, hashed again
+    assert not verify_md5(f, expected).passed
+    assert len(hashed) == 2
+
+
+def test_verify_md5_cache(tmp_path: Path) -> None:
+    f = tmp_path / "test.bin"
+    f.write_bytes(b"hello world")
+    expected = hashlib.md5(b"hello world").hexdigest()
+    sidecar = tmp_path / "test.bin.md5.cache"
+
+    assert verify_md5(f, expected, use_cache=True).passed
+    assert sidecar.exists()
+
+    # Same size/mtime: the cached hash is trusted without re-reading
+    st = f.stat()
+    f.write_bytes(b"HELLO WORLD")
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert verify_md5(f, expected, use_cache=True).passed
+
+    # Changed mtime invalidates the cache
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert not verify_md5(f, expected, use_cache=True).passed
+    # Without use_cache the file is always hashed
+    assert not verify_md5(f, expected).passed
 
 
 def test_validate_dataset_generic(mock_bids_root: Path) -> None:
@@ -108,15 +257,373 @@ def test_validate_dataset_generic(mock_bids_root: Path) -> None:
     result = validate_dataset(mock_bids_root, config, run_bids_validator=False)
 
     # Check individual results
-    zero_check = next(c for c in result.checks if c.name == "zero_byte_files")
-    assert not zero_check.passed  # Should fail due to sub-002 being 0 bytes
+    assert not result["zero_byte_files"].passed  # Should fail due to sub-002 being 0 bytes
+    assert result["required_files"].passed
+    assert result["subjects"].passed  # 2 subjects found
+    # Both files exist (one empty), so count should be 2
+    assert result["t1w_count"].passed
 
-    req_check = next(c for c in result.checks if c.name == "required_files")
-    assert req_check.passed
 
-    subj_check = next(c for c in result.checks if c.name == "subjects")
-    assert subj_check.passed  # 2 subjects found
+@pytest.fixture
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the user cache dir at a per-test directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
 
-    t1w_check = next(c for c in result.checks if c.name == "t1w_count")
-    # Both files exist (one empty), so count should be 2
-    assert t1w_check.passed
+
+def test_check_zero_byte_files_cache(
+    mutable_bids_root: Path, cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from bids_hub.validation import base
+
+    before = sorted(p.name for p in mutable_bids_root.iterdir())
+    root_mtime = mutable_bids_root.stat().st_mtime_ns
+
+    count, files = check_zero_byte_files(mutable_bids_root, use_cache=True)
+    assert count == 1
+    # The cache lives outside the dataset, which is left untouched
+    assert base._cache_path(mutable_bids_root).is_relative_to(cache_home)
+    assert base._cache_path(mutable_bids_root).exists()
+    assert sorted(p.name for p in mutable_bids_root.iterdir()) == before
+    assert mutable_bids_root.stat().st_mtime_ns == root_mtime
+
+    # Unchanged directories, root included: sizes come from the cache
+    cached_sizes = base._cached_sizes
+    hits: dict[str, bool] = {}
+
+    def recording(cache: Any, rel_dir: str, mtime_ns: int) -> dict[str, Any]:
+        sizes = cached_sizes(cache, rel_dir, mtime_ns)
+        hits[rel_dir] = bool(sizes)
+        return sizes
+
+    monkeypatch.setattr(base, "_cached_sizes", recording)
+    count, files = check_zero_byte_files(mutable_bids_root, use_cache=True)
+    assert count == 1
+    assert "sub-002_T1w.nii.gz" in files[0]
+    assert hits["."]
+    assert hits["sub-002/anat"]
+
+    # Changed directory mtime: files are re-stat'ed
+    anat = mutable_bids_root / "sub-002" / "anat"
+    (anat / "sub-002_T1w.nii.gz").write_text("fixed")
+    os.utime(anat, ns=(anat.stat().st_atime_ns, anat.stat().st_mtime_ns + 1))
+    count, _ = check_zero_byte_files(mutable_bids_root, use_cache=True)
+    assert count == 0
+    assert not hits["sub-002/anat"]
+
+
+@pytest.mark.usefixtures("cache_home")
+def test_check_zero_byte_files_cache_matches_uncached_scan(mutable_bids_root: Path) -> None:
+    anat = mutable_bids_root / "sub-001" / "anat"
+    (anat / "sub-001_T2w.nii.gz").symlink_to(anat / "missing.nii.gz")  # unfetched annex file
+
+    expected = check_zero_byte_files(mutable_bids_root)
+    assert expected[0] == 2
+    assert check_zero_byte_files(mutable_bids_root, use_cache=True) == expected
+    assert check_zero_byte_files(mutable_bids_root, use_cache=True) == expected
+
+
+@pytest.mark.usefixtures("cache_home")
+def test_check_zero_byte_files_ignores_malformed_cache_entries(mutable_bids_root: Path) -> None:
+    from bids_hub import __version__
+    from bids_hub.validation.base import _cache_path
+
+    mtime_ns = (mutable_bids_root / "sub-002" / "anat").stat().st_mtime_ns
+    dirs = {"sub-002/anat": {"mtime_ns": mtime_ns}, "sub-001/anat": "junk"}
+    cache_file = _cache_path(mutable_bids_root)
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(json.dumps({"version": __version__, "dirs": dirs}))
+
+    assert check_zero_byte_files(mutable_bids_root, use_cache=True) == (
+        1,
+        ["sub-002/anat/sub-002_T1w.nii.gz"],
+    )
+
+
+def test_check_zero_byte_files_no_cache_by_default(mock_bids_root: Path, cache_home: Path) -> None:
+    check_zero_byte_files(mock_bids_root)
+    assert not cache_home.exists()
+
+
+def test_bids_validator_prefers_deno(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from bids_hub.validation import base
+
+    monkeypatch.setattr(base.shutil, "which", lambda name: f"/usr/bin/{name}")
+    command = base._bids_validator_command(tmp_path)
+    assert command is not None
+    assert command[0] == "deno"
+
+    monkeypatch.setattr(base.shutil, "which", lambda name: None if name == "deno" else name)
+    command = base._bids_validator_command(tmp_path)
+    assert command is not None
+    assert command[0] == "npx"
+
+    monkeypatch.setattr(base.shutil, "which", lambda name: None)
+    assert base._check_bids_validator(tmp_path) is None
+
+
+def test_check_gzip_trailer(tmp_path: Path) -> None:
+    from bids_hub.validation.base import _check_gzip_trailer
+
+    good = tmp_path / "good.nii.gz"
+    good.write_bytes(gzip.compress(b"x" * 400))
+    assert _check_gzip_trailer(good)
+
+    not_gzip = tmp_path / "plain.nii.gz"
+    not_gzip.write_bytes(b"x" * 400)
+    assert not _check_gzip_trailer(not_gzip)
+
+    truncated = tmp_path / "truncated.nii.gz"
+    truncated.write_bytes(gzip.compress(b"x" * 400)[:12])
+    assert not _check_gzip_trailer(truncated)
+
+    empty_member = tmp_path / "empty.nii.gz"
+    empty_member.write_bytes(gzip.compress(b""))
+    assert not _check_gzip_trailer(empty_member)
+
+    # ISIZE is the size mod 2**32: a zero ISIZE on a non-empty member (e.g. exactly
+    # 4 GiB uncompressed) must not be reported as malformed
+    wrapped = tmp_path / "wrapped.nii.gz"
+    wrapped.write_bytes(gzip.compress(b"x" * 400)[:-4] + bytes(4))
+    assert _check_gzip_trailer(wrapped)
+
+    garbage = tmp_path / "garbage.nii.gz"
+    garbage.write_bytes(b"\x1f\x8b" + b"\xff" * 26 + bytes(4))  # zero ISIZE, undecodable
+    assert not _check_gzip_trailer(garbage)
+
+
+def test_check_gzip_trailers_skips_zero_byte(mock_bids_root: Path) -> None:
+    # sub-001 holds plain text (malformed), sub-002 is zero bytes (reported elsewhere)
+    count, files = check_gzip_trailers(mock_bids_root)
+    assert count == 1
+    assert "sub-001_T1w.nii.gz" in files[0]
+
+
+def test_nifti_integrity_reports_failing_file(tmp_path: Path) -> None:
+    import nibabel as nib
+    import numpy as np
+
+    from bids_hub.validation.base import _check_nifti_integrity
+
+    for i in range(4):
+        img = nib.Nifti1Image(np.zeros((2, 2, 2), dtype=np.float32), np.eye(4))
+        nib.save(img, tmp_path / f"sub-{i}_T1w.nii.gz")
+    (tmp_path / "sub-9_T1w.nii.gz").write_bytes(b"not a nifti")
+
+    ok = _check_nifti_integrity(tmp_path, pattern="sub-[0-3]_T1w.nii.gz", sample_size=4)
+    assert ok.passed
+    assert ok.actual == "4/4 passed"
+
+    bad = _check_nifti_integrity(tmp_path, sample_size=5)
+    assert not bad.passed
+    assert bad.details == "Failed on: sub-9_T1w.nii.gz"
+
+    # -n 0 from the CLI: nothing sampled, nothing failed
+    empty = _check_nifti_integrity(tmp_path, sample_size=0)
+    assert empty.passed
+    assert empty.actual == "0/0 passed"
+
+
+def test_count_sessions_with_modalities(tmp_path: Path) -> None:
+    from bids_hub.validation.base import _count_sessions_with_modalities
+
+    patterns = {"t1w": "*_T1w.nii.gz", "bold": "*_bold.nii.gz", "dwi": "*_dwi.nii.gz"}
+    for sub, ses, rel in [
+        ("sub-1", "ses-1", "anat/sub-1_ses-1_T1w.nii.gz"),
+        ("sub-1", "ses-1", "anat/sub-1_ses-1_run-2_T1w.nii.gz"),  # same session: counted once
+        ("sub-1", "ses-1", "func/sub-1_ses-1_task-x_bold.nii.gz"),
+        ("sub-1", "ses-2", "func/nested/sub-1_ses-2_task-x_bold.nii.gz"),  # any depth
+        ("sub-2", "ses-1", "anat/sub-2_ses-1_T1w.json"),  # not a match
+    ]:
+        path = tmp_path / sub / ses / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+
+    assert _count_sessions_with_modalities(tmp_path, patterns) == {"t1w": 1, "bold": 2, "dwi": 0}
+
+    # Without ses-* dirs, subjects are the counting unit
+    flat = tmp_path / "flat"
+    (flat / "sub-1" / "anat").mkdir(parents=True)
+    (flat / "sub-1" / "anat" / "sub-1_T1w.nii.gz").write_bytes(b"x")
+    (flat / "sub-2").mkdir()
+    assert _count_sessions_with_modalities(flat, {"t1w": "*_T1w.nii.gz"}) == {"t1w": 1}
+
+
+def test_validate_dataset_walks_tree_once(
+    mock_bids_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from bids_hub.validation import base
+
+    calls: list[Path] = []
+    scan_tree = base._scan_tree
+
+    def counting_scan_tree(root: Path) -> base._ScanContext:
+        calls.append(root)
+        return scan_tree(root)
+
+    monkeypatch.setattr(base, "_scan_tree", counting_scan_tree)
+    config = DatasetValidationConfig(
+        name="test_ds",
+        expected_counts={"subjects": 2, "sessions": 0, "t1w": 2},
+        required_files=[],
+        modality_patterns={"t1w": "*_T1w.nii.gz"},
+    )
+    validate_dataset(mock_bids_root, config)
+    assert len(calls) == 1
+
+
+def test_scan_context_matches_pathlib_glob(mutable_bids_root: Path) -> None:
+    from bids_hub.validation.base import _scan_tree
+
+    (mutable_bids_root / "sub-001" / "ses-1").mkdir()
+    (mutable_bids_root / "sub-notes.txt").write_text("x")
+    scan = _scan_tree(mutable_bids_root)
+
+    for pattern in ("sub-*", "sub-*/ses-*", "sub-*/anat"):
+        assert scan.glob_count(pattern) == len(list(mutable_bids_root.glob(pattern))), pattern
+    assert sorted(scan.rglob("*_T1w.nii.gz")) == sorted(mutable_bids_root.rglob("*_T1w.nii.gz"))
+
+
+def test_scan_context_matches_pathlib_for_classes_and_double_star(tmp_path: Path) -> None:
+    from bids_hub.validation.base import _scan_tree
+
+    names = [
+        "sub-01/ses-1/anat/sub-01_run-1_T1w.nii.gz",
+        "sub-01/ses-1/anat/sub-01_run-3_T1w.nii.gz",
+        "sub-02/anat/sub-02_run-2_bold.nii.gz",
+        "sub-02/anat/a]b^c-d.nii",
+    ]
+    for name in names:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).touch()
+    scan = _scan_tree(tmp_path)
+
+    for pattern in ("*_run-[12]_*.nii.gz", "*[]^]*", "*[!a-z_.0-9-]*", "*[", "**/anat/*"):
+        expected = sorted(p for p in tmp_path.rglob(pattern) if p.is_file())
+        assert sorted(scan.rglob(pattern)) == expected, pattern
+    for pattern in ("sub-0[!1]/*", "sub-01/**/*_T1w.nii.gz"):
+        assert scan.glob_count(pattern) == len(list(tmp_path.glob(pattern))), pattern
+
+    config = DatasetValidationConfig("test_ds", {"t1w": 1}, [], {"t1w": "*_run-[12]_T1w.nii.gz"})
+    assert validate_dataset(tmp_path, config)["t1w_count"].actual == "1"
+
+
+@pytest.mark.parametrize("pattern", ["", "/abs/*.nii.gz", "sub-*/**"])
+def test_glob_to_regex_rejects_unsupported_patterns(pattern: str) -> None:
+    from bids_hub.validation.base import _glob_to_regex
+
+    with pytest.raises(ValueError, match="Unsupported glob pattern"):
+        _glob_to_regex(pattern)
+
+
+def test_any_of_matches_union_of_patterns() -> None:
+    from bids_hub.validation.base import _any_of, _glob_to_regex
+
+    combined = _any_of([_glob_to_regex("*_T1w.nii.gz"), _glob_to_regex("*.nii.gz")])
+    assert combined.fullmatch("sub-1_T1w.nii.gz")
+    assert combined.fullmatch("sub-1_bold.nii.gz")
+    assert not combined.fullmatch("sub-1_T1w.json")
+    assert not combined.fullmatch("anat/sub-1_T1w.nii.gz")  # `*` never crosses `/`
+
+
+def test_validate_dataset_fail_fast_skips_expensive_checks(
+    mock_bids_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from bids_hub.validation import base
+
+    def no_scan(root: Path) -> base._ScanContext:
+        raise AssertionError("tree walked despite failed precondition")
+
+    config = DatasetValidationConfig(
+        name="test_ds",
+        expected_counts={"subjects": 2, "t1w": 2},
+        required_files=["participants.tsv"],  # missing
+        modality_patterns={"t1w": "*_T1w.nii.gz"},
+    )
+    monkeypatch.setattr(base, "_scan_tree", no_scan)
+    result = validate_dataset(mock_bids_root, config, fail_fast=True)
+
+    assert not result["required_files"].passed
+    assert result["subjects"].passed
+    assert result["zero_byte_files"].skipped
+    assert result.by_name("t1w_count") is None
+    assert not result.all_passed
+
+    # Preconditions met: the full validation runs, reusing the precondition checks
+    monkeypatch.undo()
+    count_subject_dirs = base._count_subject_dirs
+    calls: list[Path] = []
+
+    def counting(directory: Path) -> int:
+        calls.append(directory)
+        return count_subject_dirs(directory)
+
+    monkeypatch.setattr(base, "_count_subject_dirs", counting)
+    config = DatasetValidationConfig("test_ds", {"subjects": 2}, [], {})
+    result = validate_dataset(mock_bids_root, config, fail_fast=True)
+    assert not result["zero_byte_files"].skipped
+    assert [c.name for c in result.checks].count("subjects") == 1
+    assert len(calls) == 1
+
+
+def test_check_required_files_top_level_and_nested(tmp_path: Path) -> None:
+    from bids_hub.validation.base import _check_required_files
+
+    (tmp_path / "dataset_description.json").write_text("{}")
+    (tmp_path / "phenotype").mkdir()
+    (tmp_path / "phenotype" / "clinical.tsv").write_text("")
+
+    ok = _check_required_files(tmp_path, ["dataset_description.json", "phenotype/clinical.tsv"])
+    assert ok.passed
+
+    bad = _check_required_files(tmp_path, ["participants.tsv", "phenotype/missing.tsv"])
+    assert not bad.passed
+    assert bad.details == "Missing: participants.tsv, phenotype/missing.tsv"
+
+
+def test_scan_tree_follows_symlinked_dirs_once(tmp_path: Path) -> None:
+    from bids_hub.validation.base import _scan_tree
+
+    real = tmp_path / "store" / "sub-01"
+    (real / "ses-1" / "anat").mkdir(parents=True)
+    (real / "ses-1" / "anat" / "sub-01_ses-1_T1w.nii.gz").write_bytes(b"x")
+    (real / "ses-1" / "loop").symlink_to(real)  # cycle back to the subject dir
+    root = tmp_path / "ds"
+    root.mkdir()
+    (root / "sub-01").symlink_to(real)
+
+    scan = _scan_tree(root)
+    assert scan.glob_count("sub-*/ses-*") == len(list(root.glob("sub-*/ses-*"))) == 1
+    assert [f for f, _ in scan.files] == ["sub-01/ses-1/anat/sub-01_ses-1_T1w.nii.gz"]
+    # Unlike Path.rglob on Python < 3.13, recursive checks see files behind the link
+    (real / "ses-1" / "anat" / "sub-01_ses-1_T2w.nii.gz").touch()
+    assert check_zero_byte_files(root) == (1, ["sub-01/ses-1/anat/sub-01_ses-1_T2w.nii.gz"])
+
+    config = DatasetValidationConfig(
+        name="test_ds",
+        expected_counts={"sessions": 1, "t1w": 1},
+        required_files=[],
+        modality_patterns={"t1w": "*_T1w.nii.gz"},
+    )
+    result = validate_dataset(root, config)
+    assert result["sessions"].passed
+    assert result["t1w_count"].actual == "1"
+
+
+def test_scan_tree_skips_unreadable_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from bids_hub.validation import base
+
+    (tmp_path / "ok").mkdir()
+    (tmp_path / "ok" / "a.nii.gz").write_bytes(b"x")
+    (tmp_path / "locked").mkdir()
+    scandir = os.scandir
+
+    def scandir_denying_locked(path: Any) -> Any:
+        if Path(path).name == "locked":
+            raise PermissionError(13, "Permission denied", str(path))
+        return scandir(path)
+
+    monkeypatch.setattr(base.os, "scandir", scandir_denying_locked)
+    scan = base._scan_tree(tmp_path)
+    assert [f for f, _ in scan.files] == ["ok/a.nii.gz"]
+    assert sorted(scan.dirs) == ["locked", "ok"]
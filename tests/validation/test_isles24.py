@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -15,10 +18,10 @@ from bids_hub.validation.isles24 import (
 )
 
 
-@pytest.fixture
-def mock_isles24_root(tmp_path: Path) -> Generator[Path, None, None]:
-    """Create a mock ISLES24 structure."""
-    root = tmp_path / "train"
+@pytest.fixture(scope="module")
+def mock_isles24_root(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Create a mock ISLES24 structure, shared read-only across the module."""
+    root = tmp_path_factory.mktemp("isles24") / "train"
     root.mkdir()
 
     # Required directories
@@ -53,6 +56,12 @@ def mock_isles24_root(tmp_path: Path) -> Generator[Path, None, None]:
     yield root
 
 
+@pytest.fixture
+def mutable_isles24_root(mock_isles24_root: Path, tmp_path: Path) -> Path:
+    """Per-test copy of `mock_isles24_root` for tests that modify the tree."""
+    return Path(shutil.copytree(mock_isles24_root, tmp_path / "train"))
+
+
 def test_validate_isles24_download_structure(mock_isles24_root: Path) -> None:
     """Test ISLES24 validation on mock structure."""
     # Use strict tolerance to verify our mock fails count checks
@@ -135,3 +144,136 @@ def test_validate_isles24_tolerance(mock_isles24_root: Path) -> None:
     result_loose = validate_isles24_download(mock_isles24_root, tolerance=0.99)
     subj_loose = next(c for c in result_loose.checks if c.name == "subjects")
     assert subj_loose.passed  # 2 subjects meets 99% tolerance minimum
+
+
+def test_count_isles24_modalities_matches_glob(mutable_isles24_root: Path) -> None:
+    """Single-walk modality counts agree with per-pattern globbing."""
+    from bids_hub.validation.isles24 import (
+        ISLES24_MODALITY_PATTERNS,
+        _count_isles24_modalities,
+    )
+
+    ses01 = mutable_isles24_root / "raw_data" / "sub-stroke0001" / "ses-01"
+    (ses01 / "sub-stroke0001_ses-01_cta.nii.gz").touch()  # zero-byte: not counted
+
+    counts = _count_isles24_modalities(mutable_isles24_root, ISLES24_MODALITY_PATTERNS)
+
+    for modality, pattern in ISLES24_MODALITY_PATTERNS.items():
+        expected = sum(1 for f in mutable_isles24_root.glob(pattern) if f.stat().st_size > 0)
+        assert counts[modality] == expected, modality
+    assert counts["ncct"] == 2
+    assert counts["dwi"] == 2
+    assert counts["cta"] == 0
+
+
+def test_check_phenotype_readable_counts_rows(tmp_path: Path) -> None:
+    """Test phenotype check reports data rows (header excluded)."""
+    import pandas as pd
+
+    phenotype_dir = tmp_path / "phenotype"
+    phenotype_dir.mkdir()
+    pd.DataFrame({"participant_id": ["sub-1", "sub-2", "sub-3"], "age": [60, 70, None]}).to_excel(
+        phenotype_dir / "clinical.xlsx", index=False
+    )
+
+    # Default: the workbook is parsed
+    check = check_phenotype_readable(tmp_path)
+    assert check.passed
+    assert not check.skipped
+    assert check.actual == "3 rows"
+
+    # Shallow: ZIP directory only, no workbook parse
+    check = check_phenotype_readable(tmp_path, deep=False)
+    assert check.passed
+    assert check.actual == "valid XLSX container"
+
+    (phenotype_dir / "clinical.xlsx").write_bytes(b"not a workbook")
+    for deep in (False, True):
+        check = check_phenotype_readable(tmp_path, deep=deep)
+        assert not check.passed
+        assert check.actual == "unreadable"
+
+
+def test_validate_isles24_reads_phenotype_workbook(mutable_isles24_root: Path) -> None:
+    """Test the download validator parses the phenotype workbook, not just its ZIP."""
+    import pandas as pd
+
+    pd.DataFrame({"participant_id": ["sub-1", "sub-2"]}).to_excel(
+        mutable_isles24_root / "phenotype" / "clinical.xlsx", index=False
+    )
+    result = validate_isles24_download(mutable_isles24_root)
+    assert result["phenotype_readable"].actual == "2 rows"
+
+
+def test_check_phenotype_readable_rejects_zip_without_workbook(tmp_path: Path) -> None:
+    """Test the shallow phenotype check requires xl/workbook.xml inside the ZIP."""
+    import zipfile
+
+    phenotype_dir = tmp_path / "phenotype"
+    phenotype_dir.mkdir()
+    with zipfile.ZipFile(phenotype_dir / "clinical.xlsx", "w") as archive:
+        archive.writestr("readme.txt", "not a workbook")
+
+    check = check_phenotype_readable(tmp_path, deep=False)
+    assert not check.passed
+    assert "xl/workbook.xml" in check.details
+
+
+def test_find_first_xlsx_prefers_shallow_and_descends(tmp_path: Path) -> None:
+    """Test XLSX lookup stops at the shallowest match and searches subdirectories."""
+    from bids_hub.validation.isles24 import _find_first_xlsx
+
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "nested" / "deeper" / "deep.xlsx").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("x")
+    assert _find_first_xlsx(tmp_path) == tmp_path / "nested" / "deeper" / "deep.xlsx"
+
+    (tmp_path / "nested" / "shallow.xlsx").write_bytes(b"")
+    assert _find_first_xlsx(tmp_path) == tmp_path / "nested" / "shallow.xlsx"
+
+    with pytest.raises(FileNotFoundError):
+        _find_first_xlsx(tmp_path / "missing")
+
+
+def test_find_first_xlsx_terminates_on_symlink_loop(tmp_path: Path) -> None:
+    """Test a directory symlink cycle is entered once instead of recursing forever."""
+    from bids_hub.validation.isles24 import _find_first_xlsx
+
+    (tmp_path / "phenotype" / "a").mkdir(parents=True)
+    (tmp_path / "phenotype" / "a" / "loop").symlink_to("..")
+    assert _find_first_xlsx(tmp_path / "phenotype") is None
+
+    check = check_phenotype_readable(tmp_path)
+    assert check.skipped
+    assert check.actual == "none found"
+
+
+def test_find_first_xlsx_skips_unreadable_subdirs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an unreadable subdirectory is skipped, as rglob does."""
+    from bids_hub.validation import isles24
+
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "ok" / "deeper").mkdir(parents=True)
+    (tmp_path / "ok" / "deeper" / "clinical.xlsx").write_bytes(b"")
+    scandir = os.scandir
+
+    def scandir_denying_locked(path: Any) -> Any:
+        if Path(path).name == "locked":
+            raise PermissionError(13, "Permission denied", str(path))
+        return scandir(path)
+
+    monkeypatch.setattr(isles24.os, "scandir", scandir_denying_locked)
+    assert isles24._find_first_xlsx(tmp_path) == tmp_path / "ok" / "deeper" / "clinical.xlsx"
+
+
+def test_validate_isles24_fail_fast(mutable_isles24_root: Path) -> None:
+    """Test fail_fast skips the tree-wide checks when a cheap precondition fails."""
+    (mutable_isles24_root / "phenotype").rmdir()
+    result = validate_isles24_download(mutable_isles24_root, tolerance=0.99, fail_fast=True)
+
+    assert not result["dir_phenotype"].passed
+    assert result["subjects"].passed
+    assert result["gzip_integrity"].skipped
+    assert result.by_name("ncct_count") is None